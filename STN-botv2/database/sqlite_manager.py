@@ -126,9 +126,16 @@ class SQLiteDatabase:
             
             # Index unique pour form_id + person_id
             conn.execute("""
-                CREATE UNIQUE INDEX IF NOT EXISTS idx_responses_form_person 
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_responses_form_person
                 ON responses(form_id, person_id)
             """)
+
+            # Index couvrant pour les requêtes de non-répondants
+            # (form_id + has_responded + person_id)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_responses_form_has
+                ON responses(form_id, has_responded, person_id)
+            """)
             
             # Table app_metadata
             conn.execute("""
@@ -465,20 +472,16 @@ class SQLiteDatabase:
                 ))
                 
                 # Créer les réponses pour les personnes attendues
-                for person_id in expected_people_ids:
-                    response = Response(
-                        form_id=form.id,
-                        person_id=person_id,
-                        has_responded=False
-                    )
-                    conn.execute("""
-                        INSERT INTO responses (id, form_id, person_id, has_responded, 
-                                             created_at, updated_at)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """, (
-                        response.id, response.form_id, response.person_id, response.has_responded,
-                        response.created_at.isoformat(), response.updated_at.isoformat()
-                    ))
+                # (timestamp calculé une seule fois, pas à chaque itération)
+                now_iso = datetime.now().isoformat()
+                conn.executemany("""
+                    INSERT INTO responses (id, form_id, person_id, has_responded,
+                                         created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, [
+                    (str(uuid.uuid4()), form.id, person_id, False, now_iso, now_iso)
+                    for person_id in expected_people_ids
+                ])
                 
                 conn.commit()
                 logger.info(f"Formulaire ajouté: {form.name} (pôle: {form.pole_id}) avec {len(expected_people_ids)} personnes attendues")
@@ -579,10 +582,12 @@ class SQLiteDatabase:
         """Récupère les statistiques d'un formulaire"""
         try:
             with sqlite3.connect(self.db_path) as conn:
+                # Agrégation unique, entièrement servie par l'index couvrant
+                # idx_responses_form_has (aucune lecture des lignes)
                 cursor = conn.execute("""
-                    SELECT 
+                    SELECT
                         COUNT(*) as total,
-                        COUNT(CASE WHEN has_responded = 1 THEN 1 END) as responded
+                        COALESCE(SUM(has_responded), 0) as responded
                     FROM responses WHERE form_id = ?
                 """, (form_id,))
                 row = cursor.fetchone()
@@ -661,42 +666,70 @@ class SQLiteDatabase:
             logger.error(f"Erreur enregistrement rappel: {e}")
             return False
     
+    def get_max_response_ts(self, form_id: str) -> Optional[str]:
+        """Récupère le timestamp ISO de la réponse la plus récente d'un formulaire"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute("""
+                    SELECT MAX(response_date) FROM responses
+                    WHERE form_id = ? AND response_date IS NOT NULL
+                """, (form_id,)).fetchone()
+                return row[0] if row else None
+        except Exception as e:
+            logger.error(f"Erreur récupération timestamp max: {e}")
+            return None
+
     def get_non_responders_for_form(self, form_id: str) -> List[Tuple[Person, Response]]:
         """Récupère les non-répondants d'un formulaire avec leurs infos"""
         try:
             with sqlite3.connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
+                # Colonnes aliasées explicitement (p.* et r.* ont des noms
+                # en collision: id, created_at, updated_at)
                 cursor = conn.execute("""
-                    SELECT p.*, r.* FROM responses r
+                    SELECT p.id AS p_id, p.name AS p_name, p.email AS p_email,
+                           p.psid AS p_psid, p.created_at AS p_created_at,
+                           p.updated_at AS p_updated_at,
+                           r.id AS r_id, r.form_id, r.person_id, r.has_responded,
+                           r.response_date, r.last_reminder, r.reminder_count,
+                           r.notes, r.created_at AS r_created_at,
+                           r.updated_at AS r_updated_at
+                    FROM responses r
                     JOIN people p ON r.person_id = p.id
                     WHERE r.form_id = ? AND r.has_responded = 0
                     ORDER BY p.name
                 """, (form_id,))
-                
+
+                # Streaming par lots: le curseur ne matérialise jamais
+                # toutes les lignes d'un coup
                 non_responders = []
-                for row in cursor:
-                    person = Person(
-                        id=row['id'], 
-                        name=row['name'], 
-                        email=row['email'], 
-                        psid=row['psid'],
-                        created_at=datetime.fromisoformat(row['created_at']),
-                        updated_at=datetime.fromisoformat(row['updated_at'])
-                    )
-                    response = Response(
-                        id=row[6],
-                        form_id=row[7],
-                        person_id=row[8],
-                        has_responded=bool(row[9]),
-                        response_date=datetime.fromisoformat(row[10]) if row[10] else None,
-                        last_reminder=datetime.fromisoformat(row[11]) if row[11] else None,
-                        reminder_count=row[12],
-                        notes=row[13] or "",
-                        created_at=datetime.fromisoformat(row[14]),
-                        updated_at=datetime.fromisoformat(row[15])
-                    )
-                    non_responders.append((person, response))
-                
+                while True:
+                    batch = cursor.fetchmany(256)
+                    if not batch:
+                        break
+                    for row in batch:
+                        person = Person(
+                            id=row['p_id'],
+                            name=row['p_name'],
+                            email=row['p_email'],
+                            psid=row['p_psid'],
+                            created_at=datetime.fromisoformat(row['p_created_at']),
+                            updated_at=datetime.fromisoformat(row['p_updated_at'])
+                        )
+                        response = Response(
+                            id=row['r_id'],
+                            form_id=row['form_id'],
+                            person_id=row['person_id'],
+                            has_responded=bool(row['has_responded']),
+                            response_date=datetime.fromisoformat(row['response_date']) if row['response_date'] else None,
+                            last_reminder=datetime.fromisoformat(row['last_reminder']) if row['last_reminder'] else None,
+                            reminder_count=row['reminder_count'],
+                            notes=row['notes'] or "",
+                            created_at=datetime.fromisoformat(row['r_created_at']),
+                            updated_at=datetime.fromisoformat(row['r_updated_at'])
+                        )
+                        non_responders.append((person, response))
+
                 return non_responders
         except Exception as e:
             logger.error(f"Erreur récupération non-répondants: {e}")
@@ -957,8 +990,13 @@ class SQLiteDatabase:
                 logger.error(f"Erreur export JSON: {e}")
                 return {"error": str(e)}
             
-    def sync_google_forms_responses(self, google_responses: Dict[str, List[Dict]]) -> Dict[str, int]:
-        """Synchronise avec Google Forms - VERSION COMPLÈTE"""
+    def sync_google_forms_responses(self, google_responses: Dict[str, List[Dict]],
+                                    full_sync: bool = True) -> Dict[str, int]:
+        """Synchronise avec Google Forms - VERSION COMPLÈTE
+
+        full_sync=False pour un payload incrémental (réponses postérieures
+        à un timestamp): les absents du payload ne sont alors pas
+        re-marqués comme n'ayant pas répondu"""
         sync_stats = {"updated": 0, "created": 0, "errors": 0}
         
         try:
@@ -1077,24 +1115,28 @@ class SQLiteDatabase:
                             sync_stats["errors"] += 1
                             logger.error(f"❌ Échec marquage réponse pour {person.name}")
                     
-                    # IMPORTANT: Marquer comme N'AYANT PAS répondu ceux qui ne sont pas dans Google Forms
-                    logger.info(f"🔄 Vérification des non-répondants...")
-                    
-                    for person_id in expected_people_ids:
-                        person = self.get_person_by_id(person_id)
-                        if person and person.email:
-                            person_email = person.email.lower().strip()
-                            if person_email not in responded_emails:
-                                # Cette personne n'a PAS répondu, s'assurer qu'elle est marquée comme telle
-                                cursor = conn.execute("""
-                                    UPDATE responses 
-                                    SET has_responded = 0, response_date = NULL, updated_at = ?
-                                    WHERE form_id = ? AND person_id = ? AND has_responded = 1
-                                """, (datetime.now().isoformat(), form.id, person_id))
-                                
-                                if cursor.rowcount > 0:
-                                    logger.info(f"🔄 {person.name} re-marqué comme n'ayant PAS répondu")
-                                    sync_stats["updated"] += 1
+                    # IMPORTANT: Marquer comme N'AYANT PAS répondu ceux qui ne sont pas dans Google Forms.
+                    # Uniquement en sync complète: un payload incrémental ne
+                    # contient pas les réponses antérieures, les absents n'y
+                    # sont pas forcément des non-répondants
+                    if full_sync:
+                        logger.info(f"🔄 Vérification des non-répondants...")
+                        
+                        for person_id in expected_people_ids:
+                            person = self.get_person_by_id(person_id)
+                            if person and person.email:
+                                person_email = person.email.lower().strip()
+                                if person_email not in responded_emails:
+                                    # Cette personne n'a PAS répondu, s'assurer qu'elle est marquée comme telle
+                                    cursor = conn.execute("""
+                                        UPDATE responses 
+                                        SET has_responded = 0, response_date = NULL, updated_at = ?
+                                        WHERE form_id = ? AND person_id = ? AND has_responded = 1
+                                    """, (datetime.now().isoformat(), form.id, person_id))
+                                    
+                                    if cursor.rowcount > 0:
+                                        logger.info(f"🔄 {person.name} re-marqué comme n'ayant PAS répondu")
+                                        sync_stats["updated"] += 1
                 
                 # Mettre à jour les métadonnées
                 conn.execute("""
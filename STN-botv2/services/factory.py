@@ -98,6 +98,20 @@ class ServiceFactory:
         """Reset all services (for testing)"""
         cls._instances.clear()
         cls._initialization_errors.clear()
+
+        # Vider aussi la couche st.cache_resource des getters, sinon les
+        # anciennes instances continuent d'être servies après un reset
+        try:
+            from services import (
+                get_google_forms_service,
+                get_messenger_service,
+                get_reminder_service
+            )
+            get_google_forms_service.clear()
+            get_messenger_service.clear()
+            get_reminder_service.clear()
+        except Exception as e:
+            logger.warning(f"Impossible de vider les getters cachés: {e}")
     
     @classmethod
     def get_status(cls) -> Dict[str, str]:
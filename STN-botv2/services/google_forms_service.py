@@ -7,10 +7,21 @@ import logging
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 
+from requests.adapters import HTTPAdapter, Retry
+
 from config.settings import settings, AppConstants
 
 logger = logging.getLogger(__name__)
 
+# Session HTTP partagée: la connexion TCP/TLS vers App Script est réutilisée
+# entre les appels au lieu d'un handshake complet à chaque clic
+_HTTP = requests.Session()
+_HTTP.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+))
+
 class GoogleFormsService:
     """
     Service Google Forms utilisant App Script
@@ -25,23 +36,29 @@ class GoogleFormsService:
         logger.info("🔗 Service Google Forms initialisé avec App Script")
     
     @st.cache_data(ttl=AppConstants.CACHE_GOOGLE_FORMS, show_spinner=False)
-    def get_form_responses(_self, form_id: str) -> List[Dict[str, Any]]:
+    def get_form_responses(_self, form_id: str, since: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Récupère les réponses d'un formulaire Google via App Script
-        CACHE: 1 minute pour éviter les appels répétés
-        
+        CACHE: 1 minute en mémoire. Pas de persist="disk": le stockage
+        disque de Streamlit ignore le TTL et resservirait indéfiniment
+        la première réponse obtenue
+
         Args:
             form_id: ID du formulaire Google
-            
+            since: Timestamp ISO - ne récupérer que les réponses postérieures
+                   (sync incrémentale, None = sync complète)
+
         Returns:
             Liste des réponses avec emails et noms
         """
         try:
             logger.info(f"📞 Appel App Script pour formulaire {form_id[:10]}...")
-            
+
             # Appel à votre App Script existant
             url = f"{_self.app_script_url}?formId={form_id}"
-            response = requests.get(url, timeout=30)
+            if since:
+                url += f"&since={since}"
+            response = _HTTP.get(url, timeout=30)
             response.raise_for_status()
             
             data = response.json()
@@ -167,7 +184,7 @@ class GoogleFormsService:
                 }
             else:
                 # Test basique de connexion (sans formId) - CORRECTION ICI
-                response = requests.get(self.app_script_url, timeout=10)
+                response = _HTTP.get(self.app_script_url, timeout=10)
                 response.raise_for_status()
                 data = response.json()
                 
@@ -255,17 +272,22 @@ class GoogleFormsService:
         Returns:
             Résumé avec statistiques
         """
+        # Une seule passe sur les réponses (pas de listes intermédiaires)
         total_forms = len(responses_data)
-        total_responses = sum(len(responses) for responses in responses_data.values())
-        total_emails = len(set(
-            resp['email'] for responses in responses_data.values() 
-            for resp in responses if resp.get('email')
-        ))
-        
-        forms_with_responses = len([
-            form_id for form_id, responses in responses_data.items() 
-            if len(responses) > 0
-        ])
+        total_responses = 0
+        forms_with_responses = 0
+        unique_emails = set()
+
+        for responses in responses_data.values():
+            if responses:
+                forms_with_responses += 1
+            total_responses += len(responses)
+            for resp in responses:
+                email = resp.get('email')
+                if email:
+                    unique_emails.add(email)
+
+        total_emails = len(unique_emails)
         
         return {
             "total_forms": total_forms,
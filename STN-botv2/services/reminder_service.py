@@ -104,15 +104,18 @@ class ReminderService:
                     "form_name": form.name
                 }
             
-            # Synchroniser ce formulaire
-            form_configs = [{
-                "form_id": form.google_form_id,
-                "name": form.name,
-                "internal_id": form.id
-            }]
-            
-            google_responses = self.google_forms.get_multiple_forms_responses(form_configs)
-            sync_stats = self.db.sync_google_forms_responses(google_responses)
+            # Sync incrémentale: ne demander à App Script que les réponses
+            # postérieures à la dernière connue (None = sync complète)
+            since = self.db.get_max_response_ts(form_id)
+            if since:
+                logger.info(f"Sync incrémentale depuis {since}")
+
+            responses = self.google_forms.get_form_responses(form.google_form_id, since=since)
+            # Payload incrémental: ne pas re-marquer les absents comme
+            # non-répondants, ils ont pu répondre avant `since`
+            sync_stats = self.db.sync_google_forms_responses(
+                {form.google_form_id: responses}, full_sync=since is None
+            )
             
             result = {
                 "status": "success",
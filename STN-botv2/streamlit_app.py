@@ -5,7 +5,10 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import json
 import logging
+import sqlite3
+import uuid
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 from modules.groups_management import show_groups_management_page
@@ -260,7 +263,6 @@ def show_change_password_modal():
                 new_hash = enhanced_db._hash_password(new_password)
                 
                 try:
-                    import sqlite3
                     with sqlite3.connect(enhanced_db.db_path) as conn:
                         # Vérifier d'abord si la colonne updated_at existe
                         cursor = conn.execute("PRAGMA table_info(users)")
@@ -739,7 +741,7 @@ def show_create_form_with_pole(db, pole_id: str = None): # type: ignore
                         default_checked = person.id in selected_people_ids
                         
                         if st.checkbox(
-                            f"{person.name} ({person.email or 'pas d\'email'})",
+                            f"{person.name} ({person.email or 'pas d’email'})",
                             key=f"person_{person.id}",
                             value=default_checked
                         ):
@@ -813,7 +815,7 @@ def show_people_list(db):
     st.subheader("👥 Liste des personnes")
     
     for i, person in enumerate(people):
-        with st.expander(f"{person.name} - {person.email or 'Pas d\'email'}"):
+        with st.expander(f"{person.name} - {person.email or 'Pas d’email'}"):
             col_info, col_actions = st.columns([2, 1])
             
             with col_info:
@@ -976,7 +978,7 @@ def show_reminders_page():
                         with col1:
                             st.write(f"👤 {person['name']}")
                         with col2:
-                            st.write(f"📧 {person.get('email', 'Pas d\'email')}")
+                            st.write(f"📧 {person.get('email', 'Pas d’email')}")
                         with col3:
                             if person.get('last_reminder'):
                                 st.write(f"Dernier: {person['reminder_count']}x")
@@ -1071,11 +1073,15 @@ def show_reminders_page():
         forms_data = db.get_active_forms()
         
         if forms_data:
-            selected_form = st.selectbox(
+            # Options par id (chaînes légères) plutôt que par objet Form:
+            # Streamlit re-hache les options à chaque rerun
+            forms_by_id = {form.id: form for form, _ in forms_data}
+            selected_form_id = st.selectbox(
                 "Ou choisir un formulaire spécifique",
-                options=[form for form, _ in forms_data],
-                format_func=lambda f: f.name
+                options=list(forms_by_id),
+                format_func=lambda fid: forms_by_id[fid].name
             )
+            selected_form = forms_by_id[selected_form_id]
             
             if st.button("📧 Rappels pour ce formulaire", disabled=not can_preview):
                 # Même logique de confirmation
@@ -1117,33 +1123,43 @@ def show_sync_page():
     
     # Test de connexion
     st.subheader("🔧 Test des connexions")
-    
-    if st.button("🧪 Tester toutes les connexions"):
-        test_all_connections_ui()
-    
+    _render_connection_tests()
+
     # Synchronisation
     st.subheader("📥 Synchronisation des données")
-    
+
     col_sync_all, col_sync_specific = st.columns(2)
-    
+
     with col_sync_all:
         if st.button("🔄 Synchroniser tous les formulaires", type="primary"):
             sync_all_forms()
-    
+
     with col_sync_specific:
-        # Formulaire spécifique
-        db = get_database_manager()
-        forms_data = db.get_all_forms()
-        
-        if forms_data:
-            selected_form = st.selectbox(
-                "Synchroniser un formulaire",
-                options=[form for form, _ in forms_data],
-                format_func=lambda f: f.name
-            )
-            
-            if st.button("🔄 Synchroniser ce formulaire"):
-                sync_specific_form(selected_form.id)
+        _render_specific_form_sync()
+
+@st.fragment
+def _render_connection_tests():
+    """Bloc de test des connexions (rerun limité au fragment)"""
+    if st.button("🧪 Tester toutes les connexions"):
+        test_all_connections_ui()
+
+@st.fragment
+def _render_specific_form_sync():
+    """Sélection et sync d'un formulaire spécifique (rerun limité au fragment)"""
+    db = get_database_manager()
+    forms_data = db.get_all_forms()
+
+    if forms_data:
+        # Options par id (chaînes légères) plutôt que par objet Form
+        form_names = {form.id: form.name for form, _ in forms_data}
+        selected_form_id = st.selectbox(
+            "Synchroniser un formulaire",
+            options=list(form_names),
+            format_func=form_names.get
+        )
+
+        if st.button("🔄 Synchroniser ce formulaire"):
+            sync_specific_form(selected_form_id)
 
 def show_settings_page():
     """Page des paramètres"""
@@ -1181,14 +1197,19 @@ def show_settings_page():
     
     # Cache
     st.subheader("🧹 Gestion du cache")
-    
+    _render_cache_management(db)
+
+@st.fragment
+def _render_cache_management(db):
+    """Gestion du cache et des données (rerun limité au fragment:
+    le health check de la page n'est pas re-exécuté à chaque clic)"""
     col_clear_cache, col_clear_data = st.columns(2)
-    
+
     with col_clear_cache:
         if st.button("🧹 Vider le cache"):
             clear_all_caches()
             st.success("Cache vidé!")
-    
+
     with col_clear_data:
         if st.button("🗑️ DANGER: Effacer toutes les données", type="secondary"):
             if st.session_state.get("confirm_clear_all"):
@@ -1352,7 +1373,7 @@ def show_edit_form_modal(db, form, expected_people_ids):
                         default_checked = person.id in selected_people_ids
                         
                         if st.checkbox(
-                            f"{person.name} ({person.email or 'pas d\'email'})",
+                            f"{person.name} ({person.email or 'pas d’email'})",
                             key=f"edit_person_{person.id}",
                             value=default_checked
                         ):
@@ -1398,9 +1419,6 @@ def update_form_complete(db, form_id: str, name: str, google_form_id: str, descr
                          expected_people_ids: List[str]) -> bool:
     """Met à jour complètement un formulaire"""
     try:
-        import sqlite3
-        import json
-        
         with sqlite3.connect(db.db_path) as conn:
             # Mettre à jour le formulaire
             cursor = conn.execute("""
@@ -1440,35 +1458,31 @@ def update_form_complete(db, form_id: str, name: str, google_form_id: str, descr
             conn.execute("DELETE FROM responses WHERE form_id = ?", (form_id,))
             
             # Recréer les réponses avec les nouvelles personnes
-            from database.models import Response
+            # (timestamp calculé une seule fois, ids générés sans passer par Response())
+            now_iso = datetime.now().isoformat()
+            rows = []
             for person_id in expected_people_ids:
-                response = Response(
-                    form_id=form_id,
-                    person_id=person_id,
-                    has_responded=False
-                )
-                
                 # Si cette personne avait déjà une réponse, conserver ses données
-                if person_id in existing_data:
-                    old_data = existing_data[person_id]
-                    response.has_responded = old_data['has_responded']
-                    response.response_date = datetime.fromisoformat(old_data['response_date']) if old_data['response_date'] else None
-                    response.last_reminder = datetime.fromisoformat(old_data['last_reminder']) if old_data['last_reminder'] else None
-                    response.reminder_count = old_data['reminder_count'] or 0
-                    response.notes = old_data['notes'] or ""
-                
-                conn.execute("""
-                    INSERT INTO responses 
-                    (id, form_id, person_id, has_responded, response_date, last_reminder, 
-                     reminder_count, notes, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    response.id, response.form_id, response.person_id, response.has_responded,
-                    response.response_date.isoformat() if response.response_date else None,
-                    response.last_reminder.isoformat() if response.last_reminder else None,
-                    response.reminder_count, response.notes,
-                    response.created_at.isoformat(), response.updated_at.isoformat()
-                ))
+                old_data = existing_data.get(person_id)
+                if old_data:
+                    rows.append((
+                        str(uuid.uuid4()), form_id, person_id, old_data['has_responded'],
+                        old_data['response_date'], old_data['last_reminder'],
+                        old_data['reminder_count'] or 0, old_data['notes'] or "",
+                        now_iso, now_iso
+                    ))
+                else:
+                    rows.append((
+                        str(uuid.uuid4()), form_id, person_id, False,
+                        None, None, 0, "", now_iso, now_iso
+                    ))
+
+            conn.executemany("""
+                INSERT INTO responses
+                (id, form_id, person_id, has_responded, response_date, last_reminder,
+                 reminder_count, notes, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
             
             conn.commit()
             return True
@@ -1481,8 +1495,6 @@ def update_form_complete(db, form_id: str, name: str, google_form_id: str, descr
 def delete_form_complete(db, form_id: str) -> bool:
     """Supprime complètement un formulaire et ses réponses"""
     try:
-        import sqlite3
-        
         with sqlite3.connect(db.db_path) as conn:
             # Les réponses sont supprimées automatiquement grâce à ON DELETE CASCADE
             cursor = conn.execute("DELETE FROM forms WHERE id = ?", (form_id,))
@@ -1609,9 +1621,6 @@ def show_edit_person_modal(db, person):
 def update_person(db, person_id: str, name: str, email: str, psid: str) -> bool:
     """Met à jour une personne dans la base"""
     try:
-        import sqlite3
-        from datetime import datetime
-        
         with sqlite3.connect(db.db_path) as conn:
             cursor = conn.execute("""
                 UPDATE people 
@@ -1659,28 +1668,27 @@ def test_all_connections_ui():
         else:
             st.warning(f"⚠️ {service.title()}: {str(result)}")
 
+# Préfixes des clés de session créées par entité: la suppression se fait
+# par pop direct (O(1)) au lieu d'un scan par sous-chaîne de toutes les
+# clés, qui pouvait en plus matcher des clés d'autres entités
+_PERSON_STATE_PREFIXES = (
+    "editing_person_", "confirm_delete_person_",
+    "edit_person_", "delete_person_", "person_"
+)
+_POLE_STATE_PREFIXES = (
+    "editing_pole_", "confirm_delete_pole_",
+    "edit_pole_", "delete_pole_"
+)
+
 def cleanup_person_session_state(person_id: str):
     """Nettoie les états de session pour une personne"""
-    keys_to_remove = []
-    for key in st.session_state.keys():
-        if isinstance(key, str) and person_id in key:
-            keys_to_remove.append(key)
-    
-    for key in keys_to_remove:
-        del st.session_state[key]
+    for prefix in _PERSON_STATE_PREFIXES:
+        st.session_state.pop(prefix + person_id, None)
 
 def cleanup_pole_session_state(pole_id: str):
     """Nettoie les états de session pour un pôle"""
-    keys_to_remove = []
-    for key in st.session_state.keys():
-        if isinstance(key, str) and pole_id in key:
-            keys_to_remove.append(key)
-    
-    for key in keys_to_remove:
-        del st.session_state[key]
-
-# === IMPORTATIONS UUID SI NÉCESSAIRE ===
-import uuid
+    for prefix in _POLE_STATE_PREFIXES:
+        st.session_state.pop(prefix + pole_id, None)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
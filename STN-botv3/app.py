@@ -1,22 +1,160 @@
 import streamlit as st
+import json
+from collections import Counter
 from config import config
 from database import Database
-from services import GoogleFormsService, MessengerService, ReminderService
-from models import Person, Form, Pole, Group
+from models import Person, Form, Pole, Group, Response
+
+# === RESSOURCES PARTAGÉES ===
+# Construites une fois par processus et partagées entre reruns/sessions
+# (sans cache, chaque interaction reconstruisait Database et les services)
+
+# show_spinner=False: le spinner émettrait un élément avant le
+# st.set_page_config de run(), qui doit rester la première commande
+@st.cache_resource(show_spinner=False)
+def get_db() -> Database:
+    return Database(config.db_path)
+
+@st.cache_resource(show_spinner=False)
+def get_services(_db: Database) -> tuple:
+    # Import différé: seule la page Rappels utilise les services, les
+    # autres pages n'ont pas à payer l'import au démarrage du worker
+    from services import GoogleFormsService, MessengerService, ReminderService
+
+    google = GoogleFormsService(config.google_script_url)
+    messenger = MessengerService(config.page_token)
+    reminder = ReminderService(_db, google, messenger)
+    return google, messenger, reminder
+
+# === LECTURES CACHÉES ===
+# Streamlit relance le script entier à chaque interaction: sans cache,
+# chaque rerun refait tous les SELECT. La clé "version" est incrémentée
+# après chaque écriture pour invalider ces entrées.
+
+@st.cache_resource(show_spinner=False)
+def _data_versions() -> dict:
+    """Compteurs d'invalidation partagés par tout le processus.
+
+    En session_state ils seraient propres à chaque session: une écriture
+    dans un onglet laisserait les autres servis depuis le cache jusqu'au
+    TTL. Le cache de données étant global au processus, les compteurs
+    doivent l'être aussi.
+    """
+    return {}
+
+def _version(kind: str) -> int:
+    """Compteur d'invalidation propre à un type de données"""
+    return _data_versions().get(kind, 0)
+
+def _bump_data_version(*kinds: str):
+    """Invalide les lectures cachées des types modifiés.
+
+    Les compteurs ne font que croître: une somme de compteurs reste une
+    clé de cache valide pour les lectures qui dépendent de plusieurs types.
+    """
+    versions = _data_versions()
+    for kind in kinds:
+        versions[kind] = versions.get(kind, 0) + 1
+
+def _editing(kind: str) -> set:
+    """Ensemble des ids en cours d'édition pour un type d'entité.
+
+    Deux sets par type au lieu d'une clé session_state par ligne:
+    le state ne grossit pas avec le nombre d'éléments affichés.
+    """
+    return st.session_state.setdefault(f"editing_{kind}", set())
+
+def _confirm_delete(kind: str) -> set:
+    """Ensemble des ids en attente de confirmation de suppression"""
+    return st.session_state.setdefault(f"confirm_delete_{kind}", set())
+
+def _format_person(p) -> str:
+    """Libellé d'une personne dans les sélecteurs.
+
+    Défini une seule fois au niveau module: les widgets le rappellent pour
+    chaque option à chaque rerun, inutile de recréer la closure à chaque fois.
+    """
+    email_part = p.email or "pas d'email"
+    return f"{p.name} ({email_part})"
+
+def _format_pole(p) -> str:
+    """Libellé d'un pôle dans les sélecteurs"""
+    return p.display_name
+
+@st.cache_data(ttl="5m", max_entries=8, show_spinner=False)
+def _person_labels(db_path: str, version: int) -> list:
+    """Libellés alignés sur _load_people: calculés une fois par version
+    des données au lieu d'un appel de format_func par option par rerun"""
+    return [_format_person(p) for p in _load_people(db_path, version)]
+
+@st.cache_data(ttl="5m", max_entries=8, show_spinner=False)
+def _load_people(db_path: str, version: int) -> list:
+    return get_db().get_people()
+
+@st.cache_data(ttl="5m", max_entries=8, show_spinner=False)
+def _load_forms(db_path: str, version: int) -> list:
+    return get_db().get_forms()
+
+@st.cache_data(ttl="5m", max_entries=8, show_spinner=False)
+def _load_poles(db_path: str, version: int) -> list:
+    return get_db().get_poles()
+
+@st.cache_data(ttl="5m", max_entries=8, show_spinner=False)
+def _load_groups(db_path: str, version: int) -> list:
+    return get_db().get_groups()
+
+@st.cache_data(ttl="5m", max_entries=8, show_spinner=False)
+def _load_forms_lite(db_path: str, version: int) -> list:
+    return get_db().get_forms_lite()
+
+@st.cache_data(ttl="5m", max_entries=8, show_spinner=False)
+def _load_form_counts(db_path: str, version: int) -> dict:
+    return get_db().get_form_counts_by_pole()
+
+# Aperçu limité: la page n'affiche que 5 non-répondants par formulaire
+NON_RESPONDERS_PREVIEW = 5
+
+@st.cache_data(ttl="5m", max_entries=8, show_spinner=False)
+def _load_non_responders_bulk(db_path: str, form_ids: tuple, version: int) -> dict:
+    return get_db().get_non_responders_bulk(
+        list(form_ids), limit=NON_RESPONDERS_PREVIEW
+    )
+
+@st.cache_data(ttl="5m", max_entries=8, show_spinner=False)
+def _load_non_responder_counts(db_path: str, form_ids: tuple, version: int) -> dict:
+    return get_db().get_non_responder_counts(list(form_ids))
+
+# Pagination des listes: Streamlit sérialise chaque widget vers le
+# frontend à chaque rerun, donc le coût de rendu croît avec le nombre
+# de lignes affichées
+PAGE_SIZE = 20
+
+def _paginate(items: list, state_key: str) -> list:
+    """Ne rend que la page courante d'une liste"""
+    if len(items) <= PAGE_SIZE:
+        return items
+    total_pages = -(-len(items) // PAGE_SIZE)
+    page = st.number_input(
+        f"Page (1-{total_pages})", min_value=1, max_value=total_pages,
+        value=1, key=state_key
+    )
+    start = (page - 1) * PAGE_SIZE
+    return items[start:start + PAGE_SIZE]
 
 class STNBot:
     """Application principale complète avec CRUD complet"""
     
     def __init__(self):
-        self.db = Database(config.db_path)
-        
-        if config.is_valid():
-            self.google = GoogleFormsService(config.google_script_url)
-            self.messenger = MessengerService(config.page_token)
-            self.reminder = ReminderService(self.db, self.google, self.messenger)
-        else:
+        self.db = get_db()
+
+        if not config.is_valid():
             st.error("Configuration invalide - vérifiez votre fichier .env")
             st.stop()
+
+    @property
+    def reminder(self) -> "ReminderService":
+        """Service de rappels, construit à la première utilisation"""
+        return get_services(self.db)[2]
     
     def run(self):
         """Lance l'application"""
@@ -41,8 +179,10 @@ class STNBot:
             ]
         )
         
-        # DEBUG Global dans sidebar
-        self.show_debug_sidebar()
+        # DEBUG Global dans sidebar (le fragment est appelé dans le
+        # conteneur: st.sidebar n'est pas supporté depuis un fragment)
+        with st.sidebar:
+            self.show_debug_sidebar()
         
         if page == "📊 Dashboard":
             self.show_dashboard()
@@ -57,64 +197,69 @@ class STNBot:
         elif page == "🔔 Rappels":
             self.show_reminders()
     
+    @st.fragment
     def show_debug_sidebar(self):
-        """Debug global dans la sidebar"""
-        st.sidebar.markdown("---")
-        st.sidebar.subheader("🔍 Debug")
+        """Debug global, rendu dans la sidebar via le with du run()
+        (fragment: le bouton de réparation ne relance pas toute la page)"""
+        st.markdown("---")
+        st.subheader("🔍 Debug")
         
-        all_forms = self.db.get_forms()
-        poles = self.db.get_poles()
-        
-        st.sidebar.write(f"📋 {len(all_forms)} formulaires total")
-        st.sidebar.write(f"🏢 {len(poles)} pôles")
-        
-        # Afficher chaque formulaire avec son pôle
+        all_forms = _load_forms(config.db_path, _version("forms") + _version("responses"))
+        poles = _load_poles(config.db_path, _version("poles"))
+
+        st.write(f"📋 {len(all_forms)} formulaires total")
+        st.write(f"🏢 {len(poles)} pôles")
+
+        # Afficher chaque formulaire avec son pôle (index construit une
+        # fois au lieu d'un SELECT par formulaire)
+        poles_by_id = {p.id: p for p in poles}
         for form in all_forms:
-            pole = self.db.get_pole(form.pole_id) if form.pole_id else None
+            pole = poles_by_id.get(form.pole_id)
             pole_name = pole.name if pole else "❌ ORPHELIN"
-            st.sidebar.write(f"• {form.name} → {pole_name}")
+            st.write(f"• {form.name} → {pole_name}")
         
-        if st.sidebar.button("🔧 Réparer orphelins"):
+        if st.button("🔧 Réparer orphelins"):
             self.repair_orphaned_forms()
-            st.rerun()
+            st.rerun(scope="app")
     
     def repair_orphaned_forms(self):
         """Répare les formulaires orphelins - VERSION CORRIGÉE"""
         poles = self.db.get_poles()
         if not poles:
-            st.sidebar.error("Aucun pôle disponible")
+            st.error("Aucun pôle disponible")
             return
         
         default_pole = poles[0]
         all_forms = self.db.get_forms()
-        repaired = 0
-        
-        import sqlite3
-        with sqlite3.connect(self.db.db_path) as conn:
-            for form in all_forms:
-                # Vérifier si le pole_id existe vraiment
-                pole_exists = any(p.id == form.pole_id for p in poles)
-                
-                if not form.pole_id or not pole_exists:
-                    conn.execute(
-                        "UPDATE forms SET pole_id = ? WHERE id = ?",
-                        (default_pole.id, form.id)
-                    )
-                    repaired += 1
-                    st.sidebar.success(f"✅ {form.name} → {default_pole.name}")
-            
-            conn.commit()
-        
-        st.sidebar.success(f"🔧 {repaired} formulaire(s) réparé(s)")
+
+        # Détection en O(N): un set des pôles valides, puis un seul
+        # executemany au lieu d'un UPDATE par formulaire orphelin
+        valid_pole_ids = {p.id for p in poles}
+        orphans = [
+            form for form in all_forms
+            if not form.pole_id or form.pole_id not in valid_pole_ids
+        ]
+
+        if orphans:
+            with self.db.lock:
+                self.db.conn.executemany(
+                    "UPDATE forms SET pole_id = ? WHERE id = ?",
+                    [(default_pole.id, form.id) for form in orphans]
+                )
+            _bump_data_version("forms")
+            for form in orphans:
+                st.success(f"✅ {form.name} → {default_pole.name}")
+
+        st.success(f"🔧 {len(orphans)} formulaire(s) réparé(s)")
     
     def show_dashboard(self):
         """Dashboard avec stats complètes"""
         st.header("📊 Dashboard")
         
-        people = self.db.get_people()
-        forms = self.db.get_forms()
-        poles = self.db.get_poles()
-        groups = self.db.get_groups()
+        people = _load_people(config.db_path, _version("people"))
+        forms = _load_forms(config.db_path, _version("forms") + _version("responses"))
+        poles = _load_poles(config.db_path, _version("poles"))
+        groups = _load_groups(config.db_path, _version("groups"))
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -126,12 +271,12 @@ class STNBot:
         with col4:
             st.metric("📋 Formulaires", len(forms))
         
-        # Répartition par pôle
+        # Répartition par pôle (un seul passage sur les formulaires)
         if poles and forms:
             st.subheader("📊 Répartition des formulaires par pôle")
+            counts = Counter(f.pole_id for f in forms)
             for pole in poles:
-                pole_forms = [f for f in forms if f.pole_id == pole.id]
-                st.write(f"🏢 **{pole.name}**: {len(pole_forms)} formulaire(s)")
+                st.write(f"🏢 **{pole.name}**: {counts.get(pole.id, 0)} formulaire(s)")
     
     def show_people(self):
         """Gestion des personnes avec CRUD complet"""
@@ -140,35 +285,10 @@ class STNBot:
         tab_list, tab_add = st.tabs(["📄 Liste des personnes", "➕ Ajouter"])
         
         with tab_list:
-            people = self.db.get_people()
+            people = _load_people(config.db_path, _version("people"))
             if people:
-                for person in people:
-                    with st.expander(f"👤 {person.name}"):
-                        col_info, col_actions = st.columns([2, 1])
-                        
-                        with col_info:
-                            email_display = person.email or "Non défini"
-                            psid_display = person.psid or "Non défini"
-                            st.write(f"**Email:** {email_display}")
-                            st.write(f"**PSID:** {psid_display}")
-                            st.write(f"**Ajouté le:** {person.created_at.strftime('%d/%m/%Y')}")
-                        
-                        with col_actions:
-                            col_edit, col_del = st.columns(2)
-                            
-                            with col_edit:
-                                if st.button("✏️", key=f"edit_person_{person.id}", help="Modifier"):
-                                    st.session_state[f"editing_person_{person.id}"] = True
-                                    st.rerun()
-                            
-                            with col_del:
-                                if st.button("🗑️", key=f"del_person_{person.id}", help="Supprimer"):
-                                    if self.delete_person_safe(person.id, person.name):
-                                        st.rerun()
-                        
-                        # Modal d'édition
-                        if st.session_state.get(f"editing_person_{person.id}"):
-                            self.show_edit_person_modal(person)
+                for person in _paginate(people, "people_page"):
+                    self._person_row(person)
             else:
                 st.info("Aucune personne enregistrée")
         
@@ -190,10 +310,41 @@ class STNBot:
                     else:
                         person = Person(name=name, email=email, psid=psid)
                         if self.db.add_person(person):
+                            _bump_data_version("people", "responses")
                             st.success(f"✅ Personne '{name}' ajoutée avec succès!")
                         else:
                             st.error("❌ Erreur lors de l'ajout (doublon possible)")
     
+    @st.fragment
+    def _person_row(self, person):
+        """Ligne d'une personne (fragment: éditer/supprimer ne relance
+        que cette ligne, pas toute la page)"""
+        with st.expander(f"👤 {person.name}"):
+            col_info, col_actions = st.columns([2, 1])
+
+            with col_info:
+                email_display = person.email or "Non défini"
+                psid_display = person.psid or "Non défini"
+                st.write(f"**Email:** {email_display}")
+                st.write(f"**PSID:** {psid_display}")
+                st.write(f"**Ajouté le:** {person.created_at_display}")
+
+            with col_actions:
+                col_edit, col_del = st.columns(2)
+
+                with col_edit:
+                    if st.button("✏️", key=f"edit_person_{person.id}", help="Modifier"):
+                        _editing("person").add(person.id)
+
+                with col_del:
+                    if st.button("🗑️", key=f"del_person_{person.id}", help="Supprimer"):
+                        if self.delete_person_safe(person.id, person.name):
+                            st.rerun(scope="app")
+
+            # Modal d'édition
+            if person.id in _editing("person"):
+                self.show_edit_person_modal(person)
+
     def show_edit_person_modal(self, person):
         """Modal d'édition d'une personne"""
         with st.form(f"edit_person_{person.id}"):
@@ -210,43 +361,45 @@ class STNBot:
                 cancelled = st.form_submit_button("❌ Annuler")
             
             if cancelled:
-                del st.session_state[f"editing_person_{person.id}"]
+                _editing("person").discard(person.id)
                 st.rerun()
             
             if saved:
                 if self.update_person(person.id, new_name, new_email, new_psid):
                     st.success("Personne mise à jour!")
-                    del st.session_state[f"editing_person_{person.id}"]
-                    st.rerun()
+                    _editing("person").discard(person.id)
+                    st.rerun(scope="app")
                 else:
                     st.error("Erreur lors de la mise à jour")
     
     def delete_person_safe(self, person_id: str, person_name: str) -> bool:
         """Suppression sécurisée d'une personne"""
-        if st.session_state.get(f"confirm_delete_person_{person_id}"):
+        if person_id in _confirm_delete("person"):
             if self.db.delete_person(person_id):
+                _bump_data_version("people", "responses")
                 st.success(f"Personne '{person_name}' supprimée")
-                del st.session_state[f"confirm_delete_person_{person_id}"]
+                _confirm_delete("person").discard(person_id)
                 return True
             else:
                 st.error("Erreur lors de la suppression")
                 return False
         else:
-            st.session_state[f"confirm_delete_person_{person_id}"] = True
+            _confirm_delete("person").add(person_id)
             st.warning("⚠️ Cliquez à nouveau pour confirmer la suppression")
             return False
     
     def update_person(self, person_id: str, name: str, email: str, psid: str) -> bool:
         """Met à jour une personne"""
         try:
-            import sqlite3
-            with sqlite3.connect(self.db.db_path) as conn:
-                cursor = conn.execute(
+            with self.db.lock:
+                cursor = self.db.conn.execute(
                     "UPDATE people SET name = ?, email = ?, psid = ? WHERE id = ?",
                     (name, email, psid, person_id)
                 )
-                conn.commit()
-                return cursor.rowcount > 0
+            success = cursor.rowcount > 0
+            if success:
+                _bump_data_version("people")
+            return success
         except Exception:
             return False
     
@@ -257,42 +410,15 @@ class STNBot:
         tab_list, tab_create = st.tabs(["📄 Liste des groupes", "➕ Créer un groupe"])
         
         with tab_list:
-            groups = self.db.get_groups()
+            groups = _load_groups(config.db_path, _version("groups"))
             if groups:
-                for group in groups:
-                    with st.expander(f"{group.display_name} ({group.member_count} membres)"):
-                        col_info, col_actions = st.columns([2, 1])
-                        
-                        with col_info:
-                            description_display = group.description or "Aucune"
-                            st.write(f"**Description:** {description_display}")
-                            
-                            if group.member_ids:
-                                st.write("**Membres:**")
-                                people = self.db.get_people()
-                                for person_id in group.member_ids[:5]:
-                                    person = next((p for p in people if p.id == person_id), None)
-                                    if person:
-                                        st.write(f"• {person.name}")
-                                if len(group.member_ids) > 5:
-                                    st.write(f"... et {len(group.member_ids) - 5} autres")
-                        
-                        with col_actions:
-                            col_edit, col_del = st.columns(2)
-                            
-                            with col_edit:
-                                if st.button("✏️", key=f"edit_group_{group.id}", help="Modifier"):
-                                    st.session_state[f"editing_group_{group.id}"] = True
-                                    st.rerun()
-                            
-                            with col_del:
-                                if st.button("🗑️", key=f"del_group_{group.id}", help="Supprimer"):
-                                    if self.delete_group_safe(group.id, group.name):
-                                        st.rerun()
-                        
-                        # Modal d'édition
-                        if st.session_state.get(f"editing_group_{group.id}"):
-                            self.show_edit_group_modal(group)
+                # Index construit une fois pour tous les groupes (évite un
+                # scan linéaire des personnes par membre affiché)
+                people_by_id = {
+                    p.id: p for p in _load_people(config.db_path, _version("people"))
+                }
+                for group in _paginate(groups, "groups_page"):
+                    self._group_row(group, people_by_id)
             else:
                 st.info("Aucun groupe créé")
         
@@ -308,17 +434,15 @@ class STNBot:
                 
                 description = st.text_area("Description", placeholder="Description du groupe...")
                 
-                people = self.db.get_people()
+                people = _load_people(config.db_path, _version("people"))
                 if people:
-                    def format_person_for_group(p):
-                        email_part = p.email or "pas d'email"
-                        return f"{p.name} ({email_part})"
-                    
-                    selected_members = st.multiselect(
+                    labels = _person_labels(config.db_path, _version("people"))
+                    selected_idx = st.multiselect(
                         "Sélectionner les membres",
-                        options=people,
-                        format_func=format_person_for_group
+                        options=range(len(people)),
+                        format_func=labels.__getitem__
                     )
+                    selected_members = [people[i] for i in selected_idx]
                 else:
                     selected_members = []
                     st.warning("Aucune personne disponible. Ajoutez des personnes d'abord.")
@@ -338,10 +462,46 @@ class STNBot:
                             icon=icon
                         )
                         if self.db.add_group(group):
+                            _bump_data_version("groups")
                             st.success(f"✅ Groupe '{name}' créé avec {len(selected_members)} membres!")
                         else:
                             st.error("❌ Erreur lors de la création")
     
+    @st.fragment
+    def _group_row(self, group, people_by_id):
+        """Ligne d'un groupe (fragment: rerun limité à la ligne)"""
+        with st.expander(f"{group.display_name} ({group.member_count} membres)"):
+            col_info, col_actions = st.columns([2, 1])
+
+            with col_info:
+                description_display = group.description or "Aucune"
+                st.write(f"**Description:** {description_display}")
+
+                if group.member_ids:
+                    st.write("**Membres:**")
+                    for person_id in group.member_ids[:5]:
+                        person = people_by_id.get(person_id)
+                        if person:
+                            st.write(f"• {person.name}")
+                    if len(group.member_ids) > 5:
+                        st.write(f"... et {len(group.member_ids) - 5} autres")
+
+            with col_actions:
+                col_edit, col_del = st.columns(2)
+
+                with col_edit:
+                    if st.button("✏️", key=f"edit_group_{group.id}", help="Modifier"):
+                        _editing("group").add(group.id)
+
+                with col_del:
+                    if st.button("🗑️", key=f"del_group_{group.id}", help="Supprimer"):
+                        if self.delete_group_safe(group.id, group.name):
+                            st.rerun(scope="app")
+
+            # Modal d'édition
+            if group.id in _editing("group"):
+                self.show_edit_group_modal(group)
+
     def show_edit_group_modal(self, group):
         """Modal d'édition d'un groupe"""
         with st.form(f"edit_group_{group.id}"):
@@ -352,19 +512,17 @@ class STNBot:
             new_icon = st.selectbox("Icône", ["👥", "🎓", "💼", "🏆", "🌟"], 
                                    index=["👥", "🎓", "💼", "🏆", "🌟"].index(group.icon) if group.icon in ["👥", "🎓", "💼", "🏆", "🌟"] else 0)
             
-            people = self.db.get_people()
-            current_members = [p for p in people if p.id in group.member_ids]
+            people = _load_people(config.db_path, _version("people"))
+            labels = _person_labels(config.db_path, _version("people"))
+            member_ids = set(group.member_ids)
             
-            def format_person_edit(p):
-                email_part = p.email or "pas d'email"
-                return f"{p.name} ({email_part})"
-            
-            new_members = st.multiselect(
+            new_idx = st.multiselect(
                 "Membres",
-                options=people,
-                default=current_members,
-                format_func=format_person_edit
+                options=range(len(people)),
+                default=[i for i, p in enumerate(people) if p.id in member_ids],
+                format_func=labels.__getitem__
             )
+            new_members = [people[i] for i in new_idx]
             
             col_save, col_cancel = st.columns(2)
             with col_save:
@@ -373,55 +531,56 @@ class STNBot:
                 cancelled = st.form_submit_button("❌ Annuler")
             
             if cancelled:
-                del st.session_state[f"editing_group_{group.id}"]
+                _editing("group").discard(group.id)
                 st.rerun()
             
             if saved:
                 if self.update_group(group.id, new_name, new_description, [p.id for p in new_members], new_icon):
                     st.success("Groupe mis à jour!")
-                    del st.session_state[f"editing_group_{group.id}"]
-                    st.rerun()
+                    _editing("group").discard(group.id)
+                    st.rerun(scope="app")
                 else:
                     st.error("Erreur lors de la mise à jour")
     
     def delete_group_safe(self, group_id: str, group_name: str) -> bool:
         """Suppression sécurisée d'un groupe"""
-        if st.session_state.get(f"confirm_delete_group_{group_id}"):
+        if group_id in _confirm_delete("group"):
             if self.delete_group(group_id):
                 st.success(f"Groupe '{group_name}' supprimé")
-                del st.session_state[f"confirm_delete_group_{group_id}"]
+                _confirm_delete("group").discard(group_id)
                 return True
             else:
                 st.error("Erreur lors de la suppression")
                 return False
         else:
-            st.session_state[f"confirm_delete_group_{group_id}"] = True
+            _confirm_delete("group").add(group_id)
             st.warning("⚠️ Cliquez à nouveau pour confirmer la suppression")
             return False
     
     def update_group(self, group_id: str, name: str, description: str, member_ids: list, icon: str) -> bool:
         """Met à jour un groupe"""
         try:
-            import sqlite3
-            import json
-            with sqlite3.connect(self.db.db_path) as conn:
-                cursor = conn.execute(
+            with self.db.lock:
+                cursor = self.db.conn.execute(
                     "UPDATE groups SET name = ?, description = ?, member_ids = ?, icon = ? WHERE id = ?",
                     (name, description, json.dumps(member_ids), icon, group_id)
                 )
-                conn.commit()
-                return cursor.rowcount > 0
+            success = cursor.rowcount > 0
+            if success:
+                _bump_data_version("groups")
+            return success
         except Exception:
             return False
     
     def delete_group(self, group_id: str) -> bool:
         """Supprime un groupe"""
         try:
-            import sqlite3
-            with sqlite3.connect(self.db.db_path) as conn:
-                cursor = conn.execute("DELETE FROM groups WHERE id = ?", (group_id,))
-                conn.commit()
-                return cursor.rowcount > 0
+            with self.db.lock:
+                cursor = self.db.conn.execute("DELETE FROM groups WHERE id = ?", (group_id,))
+            success = cursor.rowcount > 0
+            if success:
+                _bump_data_version("groups")
+            return success
         except Exception:
             return False
     
@@ -432,37 +591,10 @@ class STNBot:
         tab_list, tab_create = st.tabs(["📄 Liste des pôles", "➕ Créer un pôle"])
         
         with tab_list:
-            poles = self.db.get_poles()
+            poles = _load_poles(config.db_path, _version("poles"))
+            counts = _load_form_counts(config.db_path, _version("forms"))
             for pole in poles:
-                forms_count = len(self.db.get_forms_by_pole(pole.id))
-                with st.expander(f"{pole.display_name} ({forms_count} formulaire(s))"):
-                    col_info, col_actions = st.columns([2, 1])
-                    
-                    with col_info:
-                        description_display = pole.description or "Aucune"
-                        st.write(f"**Description:** {description_display}")
-                        st.markdown(f"**Couleur:** <span style='background-color: {pole.color}; padding: 2px 8px; border-radius: 3px; color: white;'>{pole.color}</span>", unsafe_allow_html=True)
-                        st.write(f"**Formulaires:** {forms_count}")
-                    
-                    with col_actions:
-                        col_edit, col_del = st.columns(2)
-                        
-                        with col_edit:
-                            if st.button("✏️", key=f"edit_pole_{pole.id}", help="Modifier"):
-                                st.session_state[f"editing_pole_{pole.id}"] = True
-                                st.rerun()
-                        
-                        with col_del:
-                            if st.button("🗑️", key=f"del_pole_{pole.id}", help="Supprimer"):
-                                if forms_count > 0:
-                                    st.error(f"Impossible: {forms_count} formulaire(s) associé(s)")
-                                else:
-                                    if self.delete_pole_safe(pole.id, pole.name):
-                                        st.rerun()
-                    
-                    # Modal d'édition
-                    if st.session_state.get(f"editing_pole_{pole.id}"):
-                        self.show_edit_pole_modal(pole)
+                self._pole_row(pole, counts.get(pole.id, 0))
         
         with tab_create:
             with st.form("create_pole_form", clear_on_submit=True):
@@ -480,10 +612,42 @@ class STNBot:
                     else:
                         pole = Pole(name=name, description=description, color=color)
                         if self.db.add_pole(pole):
+                            _bump_data_version("poles")
                             st.success(f"✅ Pôle '{name}' créé avec succès!")
                         else:
                             st.error("❌ Erreur lors de la création (nom déjà existant?)")
     
+    @st.fragment
+    def _pole_row(self, pole, forms_count: int):
+        """Ligne d'un pôle (fragment: rerun limité à la ligne)"""
+        with st.expander(f"{pole.display_name} ({forms_count} formulaire(s))"):
+            col_info, col_actions = st.columns([2, 1])
+
+            with col_info:
+                description_display = pole.description or "Aucune"
+                st.write(f"**Description:** {description_display}")
+                st.markdown(f"**Couleur:** <span style='background-color: {pole.color}; padding: 2px 8px; border-radius: 3px; color: white;'>{pole.color}</span>", unsafe_allow_html=True)
+                st.write(f"**Formulaires:** {forms_count}")
+
+            with col_actions:
+                col_edit, col_del = st.columns(2)
+
+                with col_edit:
+                    if st.button("✏️", key=f"edit_pole_{pole.id}", help="Modifier"):
+                        _editing("pole").add(pole.id)
+
+                with col_del:
+                    if st.button("🗑️", key=f"del_pole_{pole.id}", help="Supprimer"):
+                        if forms_count > 0:
+                            st.error(f"Impossible: {forms_count} formulaire(s) associé(s)")
+                        else:
+                            if self.delete_pole_safe(pole.id, pole.name):
+                                st.rerun(scope="app")
+
+            # Modal d'édition
+            if pole.id in _editing("pole"):
+                self.show_edit_pole_modal(pole)
+
     def show_edit_pole_modal(self, pole):
         """Modal d'édition d'un pôle"""
         with st.form(f"edit_pole_{pole.id}"):
@@ -500,54 +664,56 @@ class STNBot:
                 cancelled = st.form_submit_button("❌ Annuler")
             
             if cancelled:
-                del st.session_state[f"editing_pole_{pole.id}"]
+                _editing("pole").discard(pole.id)
                 st.rerun()
             
             if saved:
                 if self.update_pole(pole.id, new_name, new_description, new_color):
                     st.success("Pôle mis à jour!")
-                    del st.session_state[f"editing_pole_{pole.id}"]
-                    st.rerun()
+                    _editing("pole").discard(pole.id)
+                    st.rerun(scope="app")
                 else:
                     st.error("Erreur lors de la mise à jour")
     
     def delete_pole_safe(self, pole_id: str, pole_name: str) -> bool:
         """Suppression sécurisée d'un pôle"""
-        if st.session_state.get(f"confirm_delete_pole_{pole_id}"):
+        if pole_id in _confirm_delete("pole"):
             if self.delete_pole(pole_id):
                 st.success(f"Pôle '{pole_name}' supprimé")
-                del st.session_state[f"confirm_delete_pole_{pole_id}"]
+                _confirm_delete("pole").discard(pole_id)
                 return True
             else:
                 st.error("Erreur lors de la suppression")
                 return False
         else:
-            st.session_state[f"confirm_delete_pole_{pole_id}"] = True
+            _confirm_delete("pole").add(pole_id)
             st.warning("⚠️ Cliquez à nouveau pour confirmer la suppression")
             return False
     
     def update_pole(self, pole_id: str, name: str, description: str, color: str) -> bool:
         """Met à jour un pôle"""
         try:
-            import sqlite3
-            with sqlite3.connect(self.db.db_path) as conn:
-                cursor = conn.execute(
+            with self.db.lock:
+                cursor = self.db.conn.execute(
                     "UPDATE poles SET name = ?, description = ?, color = ? WHERE id = ?",
                     (name, description, color, pole_id)
                 )
-                conn.commit()
-                return cursor.rowcount > 0
+            success = cursor.rowcount > 0
+            if success:
+                _bump_data_version("poles")
+            return success
         except Exception:
             return False
     
     def delete_pole(self, pole_id: str) -> bool:
         """Supprime un pôle"""
         try:
-            import sqlite3
-            with sqlite3.connect(self.db.db_path) as conn:
-                cursor = conn.execute("DELETE FROM poles WHERE id = ?", (pole_id,))
-                conn.commit()
-                return cursor.rowcount > 0
+            with self.db.lock:
+                cursor = self.db.conn.execute("DELETE FROM poles WHERE id = ?", (pole_id,))
+            success = cursor.rowcount > 0
+            if success:
+                _bump_data_version("poles")
+            return success
         except Exception:
             return False
     
@@ -560,57 +726,34 @@ class STNBot:
         with tab_all:
             # SOLUTION: Afficher TOUS les formulaires sans filtre
             st.subheader("📋 Tous les formulaires")
-            all_forms = self.db.get_forms()
-            poles = self.db.get_poles()
+            all_forms = _load_forms(config.db_path, _version("forms") + _version("responses"))
+            poles = _load_poles(config.db_path, _version("poles"))
             
             if all_forms:
-                for form in all_forms:
-                    # Trouver le pôle associé
-                    pole = next((p for p in poles if p.id == form.pole_id), None)
-                    pole_name = pole.name if pole else "❌ Pôle introuvable"
-                    
-                    with st.expander(f"📋 {form.name} ({pole_name})"):
-                        col_info, col_actions = st.columns([2, 1])
-                        
-                        with col_info:
-                            st.write(f"**Google ID:** {form.google_id}")
-                            st.write(f"**Pôle:** {pole_name}")
-                            st.write(f"**Personnes:** {len(form.people_ids)}")
-                            st.write(f"**Créé le:** {form.created_at.strftime('%d/%m/%Y')}")
-                        
-                        with col_actions:
-                            col_edit, col_del = st.columns(2)
-                            
-                            with col_edit:
-                                if st.button("✏️", key=f"edit_form_{form.id}", help="Modifier"):
-                                    st.session_state[f"editing_form_{form.id}"] = True
-                                    st.rerun()
-                            
-                            with col_del:
-                                if st.button("🗑️", key=f"del_form_{form.id}", help="Supprimer"):
-                                    if self.delete_form_safe(form.id, form.name):
-                                        st.rerun()
-                            
-                            st.link_button("🔗 Voir", form.url)
-                        
-                        # Modal d'édition
-                        if st.session_state.get(f"editing_form_{form.id}"):
-                            self.show_edit_form_modal(form)
+                poles_by_id = {p.id: p for p in poles}
+                for form in _paginate(all_forms, "forms_page"):
+                    self._form_row(form, poles_by_id)
             else:
                 st.info("Aucun formulaire créé")
         
         with tab_by_pole:
             # Vue par pôle (gardée pour l'organisation)
-            poles = self.db.get_poles()
+            poles = _load_poles(config.db_path, _version("poles"))
             if poles:
+                # Compteurs groupés: le format_func est appelé une fois par
+                # option à chaque rerun, il ne doit pas requêter SQLite
+                counts = _load_form_counts(config.db_path, _version("forms"))
                 selected_pole = st.selectbox(
                     "🏢 Choisir un pôle",
                     options=poles,
-                    format_func=lambda p: f"{p.display_name} ({len(self.db.get_forms_by_pole(p.id))} formulaire(s))"
+                    format_func=lambda p: f"{p.display_name} ({counts.get(p.id, 0)} formulaire(s))"
                 )
                 
                 if selected_pole:
-                    forms = self.db.get_forms_by_pole(selected_pole.id)
+                    # Filtre la liste déjà chargée: pas de requête
+                    # supplémentaire à chaque changement de pôle
+                    all_forms = _load_forms(config.db_path, _version("forms") + _version("responses"))
+                    forms = [f for f in all_forms if f.pole_id == selected_pole.id]
                     if forms:
                         for form in forms:
                             st.write(f"📋 **{form.name}** - {len(form.people_ids)} personne(s)")
@@ -622,9 +765,43 @@ class STNBot:
         with tab_create:
             self.show_create_form_tab()
     
+    @st.fragment
+    def _form_row(self, form, poles_by_id):
+        """Ligne d'un formulaire (fragment: rerun limité à la ligne)"""
+        # Trouver le pôle associé
+        pole = poles_by_id.get(form.pole_id)
+        pole_name = pole.name if pole else "❌ Pôle introuvable"
+
+        with st.expander(f"📋 {form.name} ({pole_name})"):
+            col_info, col_actions = st.columns([2, 1])
+
+            with col_info:
+                st.write(f"**Google ID:** {form.google_id}")
+                st.write(f"**Pôle:** {pole_name}")
+                st.write(f"**Personnes:** {len(form.people_ids)}")
+                st.write(f"**Créé le:** {form.created_at_display}")
+
+            with col_actions:
+                col_edit, col_del = st.columns(2)
+
+                with col_edit:
+                    if st.button("✏️", key=f"edit_form_{form.id}", help="Modifier"):
+                        _editing("form").add(form.id)
+
+                with col_del:
+                    if st.button("🗑️", key=f"del_form_{form.id}", help="Supprimer"):
+                        if self.delete_form_safe(form.id, form.name):
+                            st.rerun(scope="app")
+
+                st.link_button("🔗 Voir", form.url)
+
+            # Modal d'édition
+            if form.id in _editing("form"):
+                self.show_edit_form_modal(form)
+
     def show_create_form_tab(self):
         """Onglet de création de formulaire"""
-        poles = self.db.get_poles()
+        poles = _load_poles(config.db_path, _version("poles"))
         if not poles:
             st.warning("⚠️ Créez d'abord un pôle")
             return
@@ -639,21 +816,19 @@ class STNBot:
             selected_pole = st.selectbox(
                 "🏢 Pôle*",
                 options=poles,
-                format_func=lambda p: p.display_name
+                format_func=_format_pole
             )
             
             # Sélection des personnes
-            people = self.db.get_people()
+            people = _load_people(config.db_path, _version("people"))
             if people:
-                def format_person_simple(p):
-                    email_part = p.email or "pas d'email"
-                    return f"{p.name} ({email_part})"
-                
-                selected_people = st.multiselect(
+                labels = _person_labels(config.db_path, _version("people"))
+                selected_idx = st.multiselect(
                     "👥 Destinataires*",
-                    options=people,
-                    format_func=format_person_simple
+                    options=range(len(people)),
+                    format_func=labels.__getitem__
                 )
+                selected_people = [people[i] for i in selected_idx]
             else:
                 selected_people = []
                 st.warning("Aucune personne disponible")
@@ -674,6 +849,7 @@ class STNBot:
                     )
                     
                     if self.db.add_form(form):
+                        _bump_data_version("forms", "responses")
                         st.success(f"✅ Formulaire '{name}' créé!")
                         st.rerun()
                     else:
@@ -687,28 +863,27 @@ class STNBot:
             new_name = st.text_input("Nom", value=form.name)
             new_google_id = st.text_input("Google ID", value=form.google_id)
             
-            poles = self.db.get_poles()
-            current_pole_idx = next((i for i, p in enumerate(poles) if p.id == form.pole_id), 0)
+            poles = _load_poles(config.db_path, _version("poles"))
+            pole_index = {p.id: i for i, p in enumerate(poles)}
+            current_pole_idx = pole_index.get(form.pole_id, 0)
             new_pole = st.selectbox(
                 "Pôle",
                 options=poles,
                 index=current_pole_idx,
-                format_func=lambda p: p.display_name
+                format_func=_format_pole
             )
             
-            people = self.db.get_people()
-            current_people = [p for p in people if p.id in form.people_ids]
-            
-            def format_person_edit_form(p):
-                email_part = p.email or "pas d'email"
-                return f"{p.name} ({email_part})"
+            people = _load_people(config.db_path, _version("people"))
+            labels = _person_labels(config.db_path, _version("people"))
+            people_ids = set(form.people_ids)
             
-            new_people = st.multiselect(
+            new_idx = st.multiselect(
                 "Destinataires",
-                options=people,
-                default=current_people,
-                format_func=format_person_edit_form
+                options=range(len(people)),
+                default=[i for i, p in enumerate(people) if p.id in people_ids],
+                format_func=labels.__getitem__
             )
+            new_people = [people[i] for i in new_idx]
             
             col_save, col_cancel = st.columns(2)
             with col_save:
@@ -717,7 +892,7 @@ class STNBot:
                 cancelled = st.form_submit_button("❌ Annuler")
             
             if cancelled:
-                del st.session_state[f"editing_form_{form.id}"]
+                _editing("form").discard(form.id)
                 st.rerun()
             
             if saved:
@@ -734,62 +909,98 @@ class STNBot:
                 else:
                     if self.update_form(form.id, clean_name, clean_google_id, safe_pole_id, safe_people_ids):
                         st.success("Formulaire mis à jour!")
-                        del st.session_state[f"editing_form_{form.id}"]
-                        st.rerun()
+                        _editing("form").discard(form.id)
+                        st.rerun(scope="app")
                     else:
                         st.error("Erreur lors de la mise à jour")
     
     def delete_form_safe(self, form_id: str, form_name: str) -> bool:
         """Suppression sécurisée d'un formulaire"""
-        if st.session_state.get(f"confirm_delete_form_{form_id}"):
+        if form_id in _confirm_delete("form"):
             if self.delete_form(form_id):
                 st.success(f"Formulaire '{form_name}' supprimé")
-                del st.session_state[f"confirm_delete_form_{form_id}"]
+                _confirm_delete("form").discard(form_id)
                 return True
             else:
                 st.error("Erreur lors de la suppression")
                 return False
         else:
-            st.session_state[f"confirm_delete_form_{form_id}"] = True
+            _confirm_delete("form").add(form_id)
             st.warning("⚠️ Cliquez à nouveau pour confirmer la suppression")
             return False
     
     def update_form(self, form_id: str, name: str, google_id: str, pole_id: str, people_ids: list) -> bool:
         """Met à jour un formulaire"""
         try:
-            import sqlite3
-            import json
-            with sqlite3.connect(self.db.db_path) as conn:
-                # Mettre à jour le formulaire
-                cursor = conn.execute(
-                    "UPDATE forms SET name = ?, google_id = ?, pole_id = ?, people_ids = ? WHERE id = ?",
-                    (name, google_id, pole_id, json.dumps(people_ids), form_id)
-                )
-                
-                # Recréer les réponses
-                conn.execute("DELETE FROM responses WHERE form_id = ?", (form_id,))
-                for person_id in people_ids:
-                    from models import Response
-                    response = Response(form_id=form_id, person_id=person_id)
-                    conn.execute(
-                        "INSERT INTO responses VALUES (?, ?, ?, ?, ?)",
-                        (response.id, response.form_id, response.person_id, response.has_responded, None)
+            with self.db.lock:
+                # Formulaire + diff des réponses dans une transaction
+                # explicite (la connexion partagée est en autocommit)
+                self.db.conn.execute("BEGIN")
+                try:
+                    # Les destinataires vivent dans responses (diff plus
+                    # bas); la colonne people_ids n'est plus alimentée
+                    cursor = self.db.conn.execute(
+                        "UPDATE forms SET name = ?, google_id = ?, pole_id = ?, people_ids = NULL WHERE id = ?",
+                        (name, google_id, pole_id, form_id)
                     )
-                
-                conn.commit()
-                return cursor.rowcount > 0
+
+                    # Diff des destinataires au lieu de tout supprimer et
+                    # réinsérer: les réponses des personnes conservées gardent
+                    # leur has_responded / last_reminder
+                    cur_ids = {
+                        row[0] for row in self.db.conn.execute(
+                            "SELECT person_id FROM responses WHERE form_id = ?",
+                            (form_id,)
+                        )
+                    }
+                    new_ids = set(people_ids)
+                    to_del = cur_ids - new_ids
+                    to_add = new_ids - cur_ids
+                    if to_del:
+                        placeholders = ",".join("?" * len(to_del))
+                        self.db.conn.execute(
+                            f"DELETE FROM responses WHERE form_id = ?"
+                            f" AND person_id IN ({placeholders})",
+                            (form_id, *to_del)
+                        )
+                    if to_add:
+                        rows = [
+                            (Response(form_id=form_id, person_id=person_id).id,
+                             form_id, person_id, False, None)
+                            for person_id in to_add
+                        ]
+                        self.db.conn.executemany(self.db.INSERT_RESPONSE_SQL, rows)
+                    self.db.conn.execute("COMMIT")
+                except Exception:
+                    self.db.conn.execute("ROLLBACK")
+                    raise
+
+            success = cursor.rowcount > 0
+            if success:
+                _bump_data_version("forms", "responses")
+            return success
         except Exception:
             return False
-    
+
     def delete_form(self, form_id: str) -> bool:
         """Supprime un formulaire et ses réponses"""
         try:
-            import sqlite3
-            with sqlite3.connect(self.db.db_path) as conn:
-                # Les réponses sont supprimées automatiquement par FK CASCADE
-                cursor = conn.execute("DELETE FROM forms WHERE id = ?", (form_id,))
-                conn.commit()
-                return cursor.rowcount > 0
+            with self.db.lock:
+                # Pas de ON DELETE CASCADE dans le schéma: purger les
+                # réponses d'abord (FK actives sur la connexion partagée),
+                # le tout dans une transaction explicite
+                self.db.conn.execute("BEGIN")
+                try:
+                    self.db.conn.execute("DELETE FROM responses WHERE form_id = ?", (form_id,))
+                    cursor = self.db.conn.execute("DELETE FROM forms WHERE id = ?", (form_id,))
+                    self.db.conn.execute("COMMIT")
+                except Exception:
+                    self.db.conn.execute("ROLLBACK")
+                    raise
+            success = cursor.rowcount > 0
+            if success:
+                _bump_data_version("forms", "responses")
+            return success
         except Exception:
             return False
     
@@ -797,46 +1008,79 @@ class STNBot:
         """Gestion des rappels - INCHANGÉE"""
         st.header("🔔 Gestion des rappels")
         
-        forms = self.db.get_forms()
+        # Version allégée: la page n'utilise ni people_ids ni created_at
+        forms = _load_forms_lite(config.db_path, _version("forms"))
         if not forms:
             st.info("Aucun formulaire disponible")
             return
         
-        # Affichage par pôle
-        poles = self.db.get_poles()
+        # Synchronisation groupée: les appels Google se recouvrent au
+        # lieu de cliquer formulaire par formulaire
+        if st.button("🔄 Tout synchroniser", key="sync_all_forms"):
+            with st.spinner("Synchronisation de tous les formulaires..."):
+                results = self.reminder.sync_all_forms(forms)
+                _bump_data_version("responses")
+                updated = sum(s["updated"] for s in results.values())
+                st.success(f"✅ {updated} mises à jour sur {len(results)} formulaires")
+        
+        # Affichage par pôle: regroupement en un seul passage au lieu
+        # de rebalayer tous les formulaires pour chaque pôle
+        form_ids = tuple(f.id for f in forms)
+        poles = _load_poles(config.db_path, _version("poles"))
+        forms_by_pole = {}
+        for f in forms:
+            forms_by_pole.setdefault(f.pole_id, []).append(f)
         for pole in poles:
-            pole_forms = [f for f in forms if f.pole_id == pole.id]
+            pole_forms = forms_by_pole.get(pole.id, [])
             if pole_forms:
                 st.subheader(f"🏢 {pole.name}")
                 
                 for form in pole_forms:
-                    with st.expander(f"📋 {form.name}"):
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            if st.button("🔄 Synchroniser", key=f"sync_{form.id}"):
-                                with st.spinner("Synchronisation..."):
-                                    stats = self.reminder.sync_form(form)
-                                    st.success(f"✅ {stats['updated']}/{stats['total']} mises à jour")
-                        
-                        with col2:
-                            if st.button("📧 Envoyer rappels", key=f"remind_{form.id}"):
-                                with st.spinner("Envoi..."):
-                                    stats = self.reminder.send_reminders(form)
-                                    st.success(f"✅ {stats['sent']} envoyés, {stats['failed']} échecs")
-                        
-                        # Aperçu des non-répondants
-                        non_responders = self.db.get_non_responders(form.id)
-                        if non_responders:
-                            st.write("**👥 Non-répondants:**")
-                            for person, response in non_responders[:5]:
-                                psid_status = "✅" if person.psid else "❌"
-                                email_display = person.email or "Pas d'email"
-                                st.write(f"{psid_status} {person.name} - {email_display}")
-                            if len(non_responders) > 5:
-                                st.write(f"... et {len(non_responders) - 5} autres")
-                        else:
-                            st.success("✅ Tout le monde a répondu!")
+                    self._reminder_form_panel(form, form_ids)
+
+    @st.fragment
+    def _reminder_form_panel(self, form, form_ids: tuple):
+        """Panneau d'un formulaire sur la page rappels (fragment: les
+        boutons sync/envoi ne relancent pas toute la page)"""
+        with st.expander(f"📋 {form.name}"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                if st.button("🔄 Synchroniser", key=f"sync_{form.id}"):
+                    with st.spinner("Synchronisation..."):
+                        stats = self.reminder.sync_form(form)
+                        _bump_data_version("responses")
+                        st.success(f"✅ {stats['updated']}/{stats['total']} mises à jour")
+            
+            with col2:
+                if st.button("📧 Envoyer rappels", key=f"remind_{form.id}"):
+                    with st.spinner("Envoi..."):
+                        stats = self.reminder.send_reminders(form)
+                        _bump_data_version("responses")
+                        st.success(f"✅ {stats['sent']} envoyés, {stats['failed']} échecs")
+            
+            # Chargé dans le fragment, après les boutons: un sync/envoi
+            # vient de bumper la version, l'aperçu reflète donc l'état
+            # d'après écriture. La clé porte tous les form_ids: une seule
+            # requête groupée alimente tous les panneaux de la page
+            non_responders = _load_non_responders_bulk(
+                config.db_path, form_ids, _version("responses") + _version("people")
+            ).get(form.id, [])
+            total = _load_non_responder_counts(
+                config.db_path, form_ids, _version("responses")
+            ).get(form.id, 0)
+            
+            # Aperçu des non-répondants (déjà limité côté SQL)
+            if non_responders:
+                st.write("**👥 Non-répondants:**")
+                for person, response in non_responders:
+                    psid_status = "✅" if person.psid else "❌"
+                    email_display = person.email or "Pas d'email"
+                    st.write(f"{psid_status} {person.name} - {email_display}")
+                if total > len(non_responders):
+                    st.write(f"... et {total - len(non_responders)} autres")
+            else:
+                st.success("✅ Tout le monde a répondu!")
 
 # Point d'entrée pour Streamlit
 if __name__ == "__main__":
@@ -1,8 +1,13 @@
 import os
+import re
 import sys
 from dataclasses import dataclass
 from typing import Optional
 
+# Une paire KEY=VALUE par ligne, commentaires ignorés — même grammaire
+# que l'ancien parseur ligne à ligne, en un seul passage regex
+_ENV_LINE_RE = re.compile(r'^[ \t]*([^#=\s\n][^=\n]*)=(.*)$', re.M)
+
 # Import et chargement des variables d'environnement - COMME DANS V2
 def setup_environment() -> bool:
     """Configure l'environnement et charge les variables"""
@@ -22,18 +27,17 @@ def load_env_manually() -> bool:
         print("❌ Fichier .env non trouvé")
         return False
     
-    line_num = 0  # Initialiser la variable
     try:
         with open(env_path, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip().strip('"\'')
+            text = f.read()
+        os.environ.update({
+            m.group(1).strip(): m.group(2).strip().strip('"\'')
+            for m in _ENV_LINE_RE.finditer(text)
+        })
         print("✅ Fichier .env chargé manuellement")
         return True
     except Exception as e:
-        print(f"❌ Erreur lecture .env ligne {line_num}: {e}")
+        print(f"❌ Erreur lecture .env: {e}")
         return False
 
 # Charger l'environnement au démarrage du module - COMME DANS V2
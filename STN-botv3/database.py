@@ -1,5 +1,6 @@
 import sqlite3
 import json
+import threading
 from pathlib import Path
 from typing import List, Optional
 from datetime import datetime
@@ -7,11 +8,37 @@ from models import Person, Form, Response, Pole, Group
 
 class Database:
     """Base de données SQLite avec pôles et groupes - VERSION CORRIGÉE"""
-    
+
+    # SQL partagé par les chemins d'insertion de réponses (add_form ici,
+    # update_form côté app): une seule chaîne = un seul plan préparé réutilisé
+    INSERT_RESPONSE_SQL = "INSERT INTO responses VALUES (?, ?, ?, ?, ?)"
+
     def __init__(self, db_path: str = "data/stn_bot.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(exist_ok=True)
         self._init_tables()
+
+        # Connexion persistante partagée (l'instance vit en cache_resource):
+        # WAL laisse les lecteurs avancer pendant une écriture, et on évite
+        # le coût open/close + fsync d'une connexion par requête.
+        # NB: le mode WAL crée des fichiers stn_bot.db-wal / -shm à côté
+        # de la base, c'est normal
+        # cached_statements: les requêtes répétées (reruns Streamlit)
+        # réutilisent leur plan préparé au lieu d'être re-parsées
+        self.conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None,
+            cached_statements=128
+        )
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-20000")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        # SQLite sérialise les écritures de toute façon: un verrou côté
+        # Python suffit pour partager la connexion entre threads Streamlit
+        self.lock = threading.Lock()
     
     def _init_tables(self):
         """Initialise les tables"""
@@ -64,7 +91,30 @@ class Database:
                     FOREIGN KEY (form_id) REFERENCES forms (id),
                     FOREIGN KEY (person_id) REFERENCES people (id)
                 );
+
+                -- Index sur les colonnes filtrées (les PRIMARY KEY TEXT ont
+                -- déjà un index implicite, inutile d'en rajouter dessus)
+                CREATE INDEX IF NOT EXISTS idx_forms_pole_id
+                    ON forms (pole_id);
+                CREATE INDEX IF NOT EXISTS idx_forms_google_id
+                    ON forms (google_id);
+                CREATE INDEX IF NOT EXISTS idx_responses_form_person
+                    ON responses (form_id, person_id, has_responded);
             """)
+
+            # Une seule réponse par (formulaire, personne). Index séparé
+            # car une base existante peut contenir des doublons: dans ce
+            # cas on garde l'ancien comportement plutôt que de planter
+            try:
+                conn.execute("""
+                    CREATE UNIQUE INDEX IF NOT EXISTS idx_responses_unique
+                        ON responses (form_id, person_id)
+                """)
+            except sqlite3.IntegrityError:
+                print("⚠️ Doublons dans responses: index unique non créé")
+
+            conn.execute("ANALYZE")
+            conn.execute("PRAGMA optimize")
             
             # Créer un pôle par défaut si aucun existe
             cursor = conn.execute("SELECT COUNT(*) FROM poles")
@@ -80,127 +130,162 @@ class Database:
     # === PEOPLE ===
     def add_person(self, person: Person) -> bool:
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
+            with self.lock:
+                self.conn.execute(
                     "INSERT INTO people VALUES (?, ?, ?, ?, ?)",
                     (person.id, person.name, person.email, person.psid, 
                      person.created_at.isoformat())
                 )
-                return True
+            return True
         except sqlite3.IntegrityError:
             return False
     
     def get_people(self) -> List[Person]:
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute("SELECT * FROM people ORDER BY name").fetchall()
+        # Colonnes explicites (ordre stable) + itération directe du curseur,
+        # avec fromisoformat en local pour éviter le lookup par ligne
+        fromiso = datetime.fromisoformat
+        with self.lock:
+            cur = self.conn.execute(
+                "SELECT id, name, email, psid, created_at FROM people ORDER BY name"
+            )
             return [
-                Person(
-                    id=row[0], name=row[1], email=row[2], psid=row[3],
-                    created_at=datetime.fromisoformat(row[4])
-                )
-                for row in rows
+                Person(id=r[0], name=r[1], email=r[2], psid=r[3],
+                       created_at=fromiso(r[4]))
+                for r in cur
             ]
     
     def get_person(self, person_id: str) -> Optional[Person]:
-        with sqlite3.connect(self.db_path) as conn:
-            row = conn.execute("SELECT * FROM people WHERE id = ?", (person_id,)).fetchone()
-            if row:
-                return Person(
-                    id=row[0], name=row[1], email=row[2], psid=row[3],
-                    created_at=datetime.fromisoformat(row[4])
-                )
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT id, name, email, psid, created_at FROM people WHERE id = ?",
+                (person_id,)
+            ).fetchone()
+        if row:
+            return Person(
+                id=row[0], name=row[1], email=row[2], psid=row[3],
+                created_at=datetime.fromisoformat(row[4])
+            )
         return None
     
     def delete_person(self, person_id: str) -> bool:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("DELETE FROM people WHERE id = ?", (person_id,))
-            return cursor.rowcount > 0
+        with self.lock:
+            # Les FK sont actives sur la connexion partagée: purger les
+            # réponses de la personne avant de la supprimer
+            self.conn.execute("BEGIN")
+            try:
+                self.conn.execute("DELETE FROM responses WHERE person_id = ?", (person_id,))
+                cursor = self.conn.execute("DELETE FROM people WHERE id = ?", (person_id,))
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        return cursor.rowcount > 0
     
     # === POLES ===
     def add_pole(self, pole: Pole) -> bool:
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
+            with self.lock:
+                self.conn.execute(
                     "INSERT INTO poles VALUES (?, ?, ?, ?, ?, ?)",
                     (pole.id, pole.name, pole.description, pole.color,
                      pole.is_active, pole.created_at.isoformat())
                 )
-                return True
+            return True
         except sqlite3.IntegrityError:
             return False
     
     def get_poles(self) -> List[Pole]:
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute("SELECT * FROM poles WHERE is_active = 1 ORDER BY name").fetchall()
+        fromiso = datetime.fromisoformat
+        with self.lock:
+            cur = self.conn.execute(
+                "SELECT id, name, description, color, is_active, created_at"
+                " FROM poles WHERE is_active = 1 ORDER BY name"
+            )
             return [
-                Pole(
-                    id=row[0], name=row[1], description=row[2], color=row[3],
-                    is_active=bool(row[4]), created_at=datetime.fromisoformat(row[5])
-                )
-                for row in rows
+                Pole(id=r[0], name=r[1], description=r[2], color=r[3],
+                     is_active=bool(r[4]), created_at=fromiso(r[5]))
+                for r in cur
             ]
     
     def get_pole(self, pole_id: str) -> Optional[Pole]:
-        with sqlite3.connect(self.db_path) as conn:
-            row = conn.execute("SELECT * FROM poles WHERE id = ?", (pole_id,)).fetchone()
-            if row:
-                return Pole(
-                    id=row[0], name=row[1], description=row[2], color=row[3],
-                    is_active=bool(row[4]), created_at=datetime.fromisoformat(row[5])
-                )
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT id, name, description, color, is_active, created_at"
+                " FROM poles WHERE id = ?",
+                (pole_id,)
+            ).fetchone()
+        if row:
+            return Pole(
+                id=row[0], name=row[1], description=row[2], color=row[3],
+                is_active=bool(row[4]), created_at=datetime.fromisoformat(row[5])
+            )
         return None
     
     # === GROUPS ===
     def add_group(self, group: Group) -> bool:
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
+            with self.lock:
+                self.conn.execute(
                     "INSERT INTO groups VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
                     (group.id, group.name, group.description, json.dumps(group.member_ids),
                      group.color, group.icon, group.is_active, group.created_at.isoformat())
                 )
-                return True
+            return True
         except sqlite3.IntegrityError:
             return False
     
     def get_groups(self) -> List[Group]:
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute("SELECT * FROM groups WHERE is_active = 1 ORDER BY name").fetchall()
+        fromiso = datetime.fromisoformat
+        with self.lock:
+            cur = self.conn.execute(
+                "SELECT id, name, description, member_ids, color, icon,"
+                " is_active, created_at"
+                " FROM groups WHERE is_active = 1 ORDER BY name"
+            )
             return [
-                Group(
-                    id=row[0], name=row[1], description=row[2],
-                    member_ids=json.loads(row[3]) if row[3] else [],
-                    color=row[4], icon=row[5], is_active=bool(row[6]),
-                    created_at=datetime.fromisoformat(row[7])
-                )
-                for row in rows
+                Group(id=r[0], name=r[1], description=r[2],
+                      member_ids=json.loads(r[3]) if r[3] else [],
+                      color=r[4], icon=r[5], is_active=bool(r[6]),
+                      created_at=fromiso(r[7]))
+                for r in cur
             ]
     
     # === FORMS - CORRIGÉ ===
     def add_form(self, form: Form) -> bool:
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                # Insérer le formulaire
+            with self.lock:
+                # Formulaire + réponses dans une transaction explicite
+                # (la connexion partagée est en autocommit)
                 print(f"🔧 Ajout formulaire: {form.name} (ID: {form.id})")
-                conn.execute(
-                    "INSERT INTO forms VALUES (?, ?, ?, ?, ?, ?)",
-                    (form.id, form.name, form.google_id, form.pole_id,
-                     json.dumps(form.people_ids), form.created_at.isoformat())
-                )
-                
-                # Créer les réponses pour chaque personne
-                print(f"📝 Création de {len(form.people_ids)} réponses...")
-                for person_id in form.people_ids:
-                    response = Response(form_id=form.id, person_id=person_id)
-                    conn.execute(
-                        "INSERT INTO responses VALUES (?, ?, ?, ?, ?)",
-                        (response.id, response.form_id, response.person_id,
-                         response.has_responded, None)
+                self.conn.execute("BEGIN")
+                try:
+                    # people_ids n'est plus sérialisé dans forms: la
+                    # table responses est la source de vérité des
+                    # destinataires (lignes plus courtes à lire)
+                    # Colonnes nommées: ALTER TABLE a ajouté pole_id en
+                    # dernière position sur les bases migrées, un INSERT
+                    # positionnel y écrirait les valeurs décalées
+                    self.conn.execute(
+                        "INSERT INTO forms (id, name, google_id, pole_id,"
+                        " people_ids, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                        (form.id, form.name, form.google_id, form.pole_id,
+                         None, form.created_at.isoformat())
                     )
-                
-                conn.commit()
-                print(f"✅ Formulaire '{form.name}' ajouté avec succès")
-                return True
+                    
+                    # Créer les réponses pour chaque personne, en un seul lot
+                    print(f"📝 Création de {len(form.people_ids)} réponses...")
+                    rows = [
+                        (Response(form_id=form.id, person_id=person_id).id,
+                         form.id, person_id, False, None)
+                        for person_id in form.people_ids
+                    ]
+                    self.conn.executemany(self.INSERT_RESPONSE_SQL, rows)
+                    self.conn.execute("COMMIT")
+                except Exception:
+                    self.conn.execute("ROLLBACK")
+                    raise
+            print(f"✅ Formulaire '{form.name}' ajouté avec succès")
+            return True
                 
         except sqlite3.IntegrityError as e:
             print(f"❌ Erreur IntegrityError: {e}")
@@ -210,43 +295,116 @@ class Database:
             return False
     
     def get_forms(self) -> List[Form]:
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute("SELECT * FROM forms ORDER BY created_at DESC").fetchall()
+        # people_ids vient de la table responses (jonction form/personne
+        # déjà maintenue par add_form/update_form): plus de json.loads
+        # par ligne, deux requêtes au total
+        fromiso = datetime.fromisoformat
+        with self.lock:
+            people_by_form = {}
+            for form_id, person_id in self.conn.execute(
+                "SELECT form_id, person_id FROM responses"
+            ):
+                people_by_form.setdefault(form_id, []).append(person_id)
+            cur = self.conn.execute(
+                "SELECT id, name, google_id, pole_id, created_at"
+                " FROM forms ORDER BY created_at DESC"
+            )
             return [
-                Form(
-                    id=row[0], name=row[1], google_id=row[2], pole_id=row[3],
-                    people_ids=json.loads(row[4]) if row[4] else [],
-                    created_at=datetime.fromisoformat(row[5])
-                )
-                for row in rows
+                Form(id=r[0], name=r[1], google_id=r[2], pole_id=r[3],
+                     people_ids=people_by_form.get(r[0], []),
+                     created_at=fromiso(r[4]))
+                for r in cur
             ]
     
     def get_forms_by_pole(self, pole_id: str) -> List[Form]:
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute("SELECT * FROM forms WHERE pole_id = ? ORDER BY created_at DESC", (pole_id,)).fetchall()
+        fromiso = datetime.fromisoformat
+        with self.lock:
+            people_by_form = {}
+            for form_id, person_id in self.conn.execute(
+                "SELECT r.form_id, r.person_id FROM responses r"
+                " JOIN forms f ON f.id = r.form_id WHERE f.pole_id = ?",
+                (pole_id,)
+            ):
+                people_by_form.setdefault(form_id, []).append(person_id)
+            cur = self.conn.execute(
+                "SELECT id, name, google_id, pole_id, created_at"
+                " FROM forms WHERE pole_id = ? ORDER BY created_at DESC",
+                (pole_id,)
+            )
             return [
-                Form(
-                    id=row[0], name=row[1], google_id=row[2], pole_id=row[3],
-                    people_ids=json.loads(row[4]) if row[4] else [],
-                    created_at=datetime.fromisoformat(row[5])
-                )
-                for row in rows
+                Form(id=r[0], name=r[1], google_id=r[2], pole_id=r[3],
+                     people_ids=people_by_form.get(r[0], []),
+                     created_at=fromiso(r[4]))
+                for r in cur
+            ]
+    
+    def get_forms_lite(self) -> List[Form]:
+        """Formulaires sans people_ids ni parsing de date.
+
+        Suffisant pour les vues liste qui n'affichent que nom/pôle et
+        passent l'objet aux services (id, google_id).
+        """
+        with self.lock:
+            cur = self.conn.execute(
+                "SELECT id, name, google_id, pole_id"
+                " FROM forms ORDER BY created_at DESC"
+            )
+            return [
+                Form(id=r[0], name=r[1], google_id=r[2], pole_id=r[3])
+                for r in cur
             ]
     
+    def get_form_counts_by_pole(self) -> dict:
+        """Nombre de formulaires par pôle en une seule requête groupée"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT pole_id, COUNT(*) FROM forms GROUP BY pole_id"
+            ).fetchall()
+        return {row[0]: row[1] for row in rows}
+
     # === RESPONSES - CORRIGÉ ===
+    def get_people_for_form(self, form_id: str) -> List[Person]:
+        """Destinataires d'un formulaire en une seule requête (via la
+        jonction responses), au lieu d'un get_person par destinataire"""
+        fromiso = datetime.fromisoformat
+        with self.lock:
+            cur = self.conn.execute(
+                "SELECT p.id, p.name, p.email, p.psid, p.created_at"
+                " FROM people p JOIN responses r ON p.id = r.person_id"
+                " WHERE r.form_id = ?",
+                (form_id,)
+            )
+            return [
+                Person(id=r[0], name=r[1], email=r[2], psid=r[3],
+                       created_at=fromiso(r[4]))
+                for r in cur
+            ]
+    
+    def mark_responded_bulk(self, form_id: str, person_ids: List[str]) -> int:
+        """Marque plusieurs personnes comme ayant répondu en un seul UPDATE"""
+        if not person_ids:
+            return 0
+        placeholders = ",".join("?" * len(person_ids))
+        with self.lock:
+            cursor = self.conn.execute(
+                f"UPDATE responses SET has_responded = 1"
+                f" WHERE form_id = ? AND person_id IN ({placeholders})",
+                (form_id, *person_ids)
+            )
+        return cursor.rowcount
+    
     def mark_responded(self, form_id: str, person_id: str) -> bool:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
+        with self.lock:
+            cursor = self.conn.execute(
                 "UPDATE responses SET has_responded = 1 WHERE form_id = ? AND person_id = ?",
                 (form_id, person_id)
             )
-            return cursor.rowcount > 0
+        return cursor.rowcount > 0
     
     def get_non_responders(self, form_id: str) -> List[tuple[Person, Response]]:
         """CORRIGÉ: Gestion des index de colonnes"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute("""
+        with self.lock:
+            cursor = self.conn.execute("""
                 SELECT 
                     p.id as person_id, p.name as person_name, p.email as person_email, 
                     p.psid as person_psid, p.created_at as person_created_at,
@@ -256,48 +414,143 @@ class Database:
                 JOIN responses r ON p.id = r.person_id
                 WHERE r.form_id = ? AND r.has_responded = 0
                 ORDER BY p.name
-            """, (form_id,)).fetchall()
-            
-            result = []
-            for row in rows:
-                person = Person(
-                    id=row['person_id'], 
-                    name=row['person_name'], 
-                    email=row['person_email'], 
-                    psid=row['person_psid'],
-                    created_at=datetime.fromisoformat(row['person_created_at'])
-                )
-                response = Response(
-                    id=row['response_id'], 
-                    form_id=row['form_id'], 
-                    person_id=row['resp_person_id'],
-                    has_responded=bool(row['has_responded']),
-                    last_reminder=datetime.fromisoformat(row['last_reminder']) if row['last_reminder'] else None
-                )
-                result.append((person, response))
-            return result
+            """, (form_id,))
+            # row_factory posé sur le curseur, pas sur la connexion partagée
+            cursor.row_factory = sqlite3.Row
+            rows = cursor.fetchall()
+        
+        result = []
+        for row in rows:
+            person = Person(
+                id=row['person_id'], 
+                name=row['person_name'], 
+                email=row['person_email'], 
+                psid=row['person_psid'],
+                created_at=datetime.fromisoformat(row['person_created_at'])
+            )
+            response = Response(
+                id=row['response_id'], 
+                form_id=row['form_id'], 
+                person_id=row['resp_person_id'],
+                has_responded=bool(row['has_responded']),
+                last_reminder=datetime.fromisoformat(row['last_reminder']) if row['last_reminder'] else None
+            )
+            result.append((person, response))
+        return result
+    
+    def get_non_responders_bulk(self, form_ids: List[str],
+                                limit: Optional[int] = None) -> dict:
+        """Non-répondants de plusieurs formulaires en une seule requête.
+
+        Évite un aller-retour SQL par formulaire sur la page des rappels.
+        Avec `limit`, seules les `limit` premières lignes par formulaire
+        sont matérialisées (aperçu): inutile de construire N dataclasses
+        pour n'en afficher que 5.
+        """
+        if not form_ids:
+            return {}
+        placeholders = ",".join("?" * len(form_ids))
+        base_query = f"""
+                SELECT 
+                    r.form_id,
+                    p.id as person_id, p.name as person_name, p.email as person_email, 
+                    p.psid as person_psid, p.created_at as person_created_at,
+                    r.id as response_id, r.person_id as resp_person_id, 
+                    r.has_responded, r.last_reminder
+                FROM people p
+                JOIN responses r ON p.id = r.person_id
+                WHERE r.form_id IN ({placeholders}) AND r.has_responded = 0
+                ORDER BY p.name
+            """
+        params = tuple(form_ids)
+        if limit is not None:
+            base_query = (
+                f"SELECT * FROM ("
+                f"SELECT *, ROW_NUMBER() OVER"
+                f" (PARTITION BY form_id ORDER BY person_name) AS rn"
+                f" FROM ({base_query})"
+                f") WHERE rn <= ?"
+            )
+            params = params + (limit,)
+        with self.lock:
+            cursor = self.conn.execute(base_query, params)
+            cursor.row_factory = sqlite3.Row
+            rows = cursor.fetchall()
+        
+        result = {form_id: [] for form_id in form_ids}
+        for row in rows:
+            person = Person(
+                id=row['person_id'], 
+                name=row['person_name'], 
+                email=row['person_email'], 
+                psid=row['person_psid'],
+                created_at=datetime.fromisoformat(row['person_created_at'])
+            )
+            response = Response(
+                id=row['response_id'], 
+                form_id=row['form_id'], 
+                person_id=row['resp_person_id'],
+                has_responded=bool(row['has_responded']),
+                last_reminder=datetime.fromisoformat(row['last_reminder']) if row['last_reminder'] else None
+            )
+            result[row['form_id']].append((person, response))
+        return result
+    
+    def get_non_responder_counts(self, form_ids: List[str]) -> dict:
+        """Nombre de non-répondants par formulaire (requête groupée)"""
+        if not form_ids:
+            return {}
+        placeholders = ",".join("?" * len(form_ids))
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT form_id, COUNT(*) FROM responses"
+                f" WHERE form_id IN ({placeholders}) AND has_responded = 0"
+                f" GROUP BY form_id",
+                tuple(form_ids)
+            ).fetchall()
+        return {row[0]: row[1] for row in rows}
     
     def record_reminder(self, form_id: str, person_id: str):
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        with self.lock:
+            self.conn.execute(
                 "UPDATE responses SET last_reminder = ? WHERE form_id = ? AND person_id = ?",
                 (datetime.now().isoformat(), form_id, person_id)
             )
-            conn.commit()
+    
+    def record_reminders(self, form_id: str, person_ids: List[str]):
+        """Enregistre une fournée de rappels en une seule transaction
+        (un commit unique au lieu d'un par personne)"""
+        if not person_ids:
+            return
+        now = datetime.now().isoformat()
+        with self.lock:
+            try:
+                self.conn.execute("BEGIN")
+                self.conn.executemany(
+                    "UPDATE responses SET last_reminder = ? WHERE form_id = ? AND person_id = ?",
+                    [(now, form_id, person_id) for person_id in person_ids]
+                )
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
     
     # === DEBUG/TEST ===
     def debug_forms(self):
         """Debug: affiche tous les formulaires"""
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute("SELECT * FROM forms").fetchall()
+        with self.lock:
+            rows = self.conn.execute("SELECT id, name FROM forms").fetchall()
             print(f"🔍 DEBUG: {len(rows)} formulaires en base:")
             for row in rows:
                 print(f"  - {row[1]} (ID: {row[0][:8]}...)")
     
     def debug_responses(self, form_id: str):
         """Debug: affiche les réponses d'un formulaire"""
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute("SELECT * FROM responses WHERE form_id = ?", (form_id,)).fetchall()
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT person_id, has_responded FROM responses WHERE form_id = ?",
+                (form_id,)
+            ).fetchall()
             print(f"🔍 DEBUG: {len(rows)} réponses pour formulaire {form_id[:8]}...")
             for row in rows:
-                print(f"  - Person {row[2][:8]}...: responded={row[3]}")
\ No newline at end of file
+                print(f"  - Person {row[0][:8]}...: responded={row[1]}")
\ No newline at end of file
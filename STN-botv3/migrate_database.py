@@ -4,12 +4,34 @@ Script de migration de base de données STN-bot v2 → v3
 Usage: python migrate_database.py
 """
 
+import json
 import sqlite3
 import os
 from pathlib import Path
 import uuid
 from datetime import datetime
 
+def _copy_database(source_path, dest_path):
+    """Copie une base via sqlite3.Connection.backup (snapshot cohérent)"""
+    source = sqlite3.connect(source_path)
+    dest = sqlite3.connect(dest_path)
+    try:
+        source.backup(dest, pages=1000)
+    finally:
+        dest.close()
+        source.close()
+
+def _tune(conn):
+    """PRAGMAs de performance: WAL persiste dans le fichier, l'application
+    en hérite après la migration"""
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-40000;
+        PRAGMA mmap_size=268435456;
+    """)
+
 def migrate_database():
     """Migre la base de données vers la v3"""
     
@@ -23,20 +45,32 @@ def migrate_database():
         create_fresh_database(db_path)
         return
     
-    # Créer une sauvegarde
+    # Créer une sauvegarde via l'API de backup SQLite: snapshot cohérent
+    # page par page, même si une autre connexion a la base ouverte (une
+    # copie de fichier brute peut capturer un état incohérent en WAL)
     backup_path = db_path.with_suffix('.backup.db')
-    import shutil
-    shutil.copy2(db_path, backup_path)
+    _copy_database(db_path, backup_path)
     print(f"💾 Sauvegarde créée: {backup_path}")
     
     try:
-        with sqlite3.connect(db_path) as conn:
+        # isolation_level=None: pas de BEGIN implicite côté Python, la
+        # transaction est pilotée par le BEGIN IMMEDIATE explicite;
+        # cache de statements élargi pour les INSERT/UPDATE répétés
+        with sqlite3.connect(db_path, isolation_level=None,
+                             cached_statements=256) as conn:
+            _tune(conn)
+            # Toute la migration dans une seule transaction: un seul
+            # fsync au commit au lieu d'un par statement, et un état
+            # cohérent si elle échoue à mi-chemin
+            conn.execute("BEGIN IMMEDIATE")
             print("🔍 Analyse de la structure actuelle...")
             
             # Vérifier les colonnes existantes
             cursor = conn.execute("PRAGMA table_info(forms)")
-            existing_columns = [row[1] for row in cursor.fetchall()]
-            print(f"📋 Colonnes forms existantes: {existing_columns}")
+            # Set construit directement depuis le curseur: test
+            # d'appartenance en O(1) et pas de liste intermédiaire
+            existing_columns = {row[1] for row in cursor}
+            print(f"📋 Colonnes forms existantes: {sorted(existing_columns)}")
             
             # === ÉTAPE 1: Créer les nouvelles tables ===
             print("\n📁 Création des nouvelles tables...")
@@ -77,13 +111,63 @@ def migrate_database():
             else:
                 print("✅ Colonne pole_id déjà présente")
             
+            # === ÉTAPE 2b: Réaligner les lignes décalées ===
+            # Sur les bases où pole_id a été ajouté par ALTER TABLE, la
+            # colonne est en dernière position alors que les INSERT
+            # positionnels la supposaient 4e: ces lignes portent le pôle
+            # dans people_ids, la liste JSON dans created_at et la date
+            # ISO dans pole_id. Une date ISO dans pole_id les trahit
+            # (un id de pôle ne contient jamais de 'T').
+            cursor = conn.execute("""
+                UPDATE forms
+                SET people_ids = created_at,
+                    created_at = pole_id,
+                    pole_id = people_ids
+                WHERE pole_id LIKE '____-__-__T%'
+            """)
+            if cursor.rowcount > 0:
+                print(f"🔧 {cursor.rowcount} formulaire(s) décalé(s) réaligné(s)")
+            
+            # Compléter la jonction responses depuis les listes JSON
+            # récupérées: les lecteurs en tirent désormais people_ids
+            missing = []
+            for form_id, raw_ids in conn.execute(
+                "SELECT id, people_ids FROM forms WHERE people_ids LIKE '[%'"
+            ).fetchall():
+                try:
+                    people_ids = json.loads(raw_ids)
+                except (ValueError, TypeError):
+                    continue
+                existing = {
+                    row[0] for row in conn.execute(
+                        "SELECT person_id FROM responses WHERE form_id = ?",
+                        (form_id,)
+                    )
+                }
+                missing.extend(
+                    (str(uuid.uuid4()), form_id, person_id)
+                    for person_id in people_ids
+                    if person_id not in existing
+                )
+            if missing:
+                conn.executemany(
+                    "INSERT INTO responses (id, form_id, person_id,"
+                    " has_responded, last_reminder) VALUES (?, ?, ?, 0, NULL)",
+                    missing
+                )
+                print(f"🔧 {len(missing)} réponse(s) recréée(s) depuis people_ids")
+            
             # === ÉTAPE 3: Créer un pôle par défaut ===
             print("\n🏢 Gestion du pôle par défaut...")
             
-            cursor = conn.execute("SELECT COUNT(*) FROM poles")
-            pole_count = cursor.fetchone()[0]
+            # EXISTS s'arrête à la première ligne: pas de scan complet
+            # juste pour savoir si la table est vide
+            has_pole = conn.execute(
+                "SELECT EXISTS(SELECT 1 FROM poles)"
+            ).fetchone()[0]
             
-            if pole_count == 0:
+            default_pole_id = None
+            if not has_pole:
                 # Créer le pôle par défaut
                 default_pole_id = str(uuid.uuid4())
                 conn.execute("""
@@ -94,25 +178,28 @@ def migrate_database():
                     "#2196F3", True, datetime.now().isoformat()
                 ))
                 print("✅ Pôle par défaut 'Général' créé")
-                
-                # Assigner tous les formulaires existants au pôle par défaut
-                cursor = conn.execute("""
-                    UPDATE forms SET pole_id = ? WHERE pole_id IS NULL OR pole_id = ''
-                """)
-                updated_forms = cursor.rowcount
-                print(f"✅ {updated_forms} formulaires assignés au pôle par défaut")
+                # L'assignation des formulaires sans pôle se fait en une
+                # seule passe dans les vérifications finales
             else:
+                # Retenir l'id du premier pôle pour la passe orphelins,
+                # au lieu de le re-sélectionner plus bas
+                default_pole_id = conn.execute(
+                    "SELECT id FROM poles ORDER BY rowid LIMIT 1"
+                ).fetchone()[0]
                 print("✅ Pôles déjà présents")
             
             # === ÉTAPE 4: Vérifications finales ===
             print("\n🔍 Vérifications finales...")
             
-            # Compter les données
-            people_count = conn.execute("SELECT COUNT(*) FROM people").fetchone()[0]
-            forms_count = conn.execute("SELECT COUNT(*) FROM forms").fetchone()[0]
-            poles_count = conn.execute("SELECT COUNT(*) FROM poles").fetchone()[0]
-            groups_count = conn.execute("SELECT COUNT(*) FROM groups").fetchone()[0]
-            responses_count = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            # Compter les données (une seule requête au lieu de cinq)
+            (people_count, forms_count, poles_count,
+             groups_count, responses_count) = conn.execute(
+                "SELECT (SELECT COUNT(*) FROM people),"
+                " (SELECT COUNT(*) FROM forms),"
+                " (SELECT COUNT(*) FROM poles),"
+                " (SELECT COUNT(*) FROM groups),"
+                " (SELECT COUNT(*) FROM responses)"
+            ).fetchone()
             
             print(f"📊 Statistiques après migration:")
             print(f"   👥 Personnes: {people_count}")
@@ -121,6 +208,13 @@ def migrate_database():
             print(f"   📋 Formulaires: {forms_count}")
             print(f"   📝 Réponses: {responses_count}")
             
+            # Index partiel: la détection et l'UPDATE des orphelins ne
+            # touchent que les lignes concernées au lieu de scanner forms
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_forms_orphan"
+                " ON forms(pole_id) WHERE pole_id IS NULL OR pole_id = ''"
+            )
+            
             # Vérifier les formulaires sans pôle
             orphaned_forms = conn.execute("""
                 SELECT COUNT(*) FROM forms WHERE pole_id IS NULL OR pole_id = ''
@@ -128,16 +222,19 @@ def migrate_database():
             
             if orphaned_forms > 0:
                 print(f"⚠️  {orphaned_forms} formulaires sans pôle détectés")
-                # Les assigner au pôle par défaut
-                default_pole = conn.execute("SELECT id FROM poles LIMIT 1").fetchone()
-                if default_pole:
-                    conn.execute("""
-                        UPDATE forms SET pole_id = ? WHERE pole_id IS NULL OR pole_id = ''
-                    """, (default_pole[0],))
-                    print(f"✅ Formulaires orphelins assignés au pôle par défaut")
+                # Les assigner au pôle par défaut déjà connu
+                # (unique passe d'écriture, pas de re-SELECT)
+                cursor = conn.execute("""
+                    UPDATE forms SET pole_id = ? WHERE pole_id IS NULL OR pole_id = ''
+                """, (default_pole_id,))
+                print(f"✅ {cursor.rowcount} formulaires orphelins assignés au pôle par défaut")
             
             conn.commit()
             
+            # Statistiques à jour pour le planificateur après les
+            # changements de schéma et de données
+            conn.execute("PRAGMA optimize")
+            
             print("\n🎉 MIGRATION RÉUSSIE!")
             print("=" * 50)
             print("✅ Votre base de données est maintenant compatible v3")
@@ -149,8 +246,13 @@ def migrate_database():
         print(f"\n💥 ERREUR DURANTE LA MIGRATION: {e}")
         print(f"🔄 Restauration de la sauvegarde...")
         
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+        
         # Restaurer la sauvegarde
-        shutil.copy2(backup_path, db_path)
+        _copy_database(backup_path, db_path)
         print("✅ Sauvegarde restaurée")
         raise
 
@@ -160,7 +262,11 @@ def create_fresh_database(db_path):
     
     db_path.parent.mkdir(exist_ok=True)
     
-    with sqlite3.connect(db_path) as conn:
+    with sqlite3.connect(db_path, isolation_level=None,
+                         cached_statements=256) as conn:
+        # page_size doit être fixé avant le passage en WAL
+        conn.execute("PRAGMA page_size=4096")
+        _tune(conn)
         conn.executescript("""
             CREATE TABLE poles (
                 id TEXT PRIMARY KEY,
@@ -209,6 +315,10 @@ def create_fresh_database(db_path):
                 FOREIGN KEY (form_id) REFERENCES forms (id),
                 FOREIGN KEY (person_id) REFERENCES people (id)
             );
+            
+            CREATE INDEX idx_forms_pole ON forms(pole_id);
+            CREATE INDEX idx_responses_form_person
+                ON responses(form_id, person_id);
         """)
         
         # Créer le pôle par défaut
@@ -222,6 +332,10 @@ def create_fresh_database(db_path):
         ))
         
         conn.commit()
+        
+        # sqlite_stat1 initialisé dès la création
+        conn.execute("ANALYZE")
+        conn.execute("PRAGMA optimize")
     
     print("✅ Nouvelle base de données v3 créée avec pôle par défaut")
 
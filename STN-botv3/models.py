@@ -3,7 +3,9 @@ from datetime import datetime
 from typing import List, Optional
 import uuid
 
-@dataclass
+# slots=True: pas de __dict__ par instance — les pages show_* rematérialisent
+# ces objets à chaque rerun, autant qu'ils restent légers
+@dataclass(slots=True)
 class Person:
     """Modèle personne"""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -11,8 +13,18 @@ class Person:
     email: str = ""
     psid: str = ""
     created_at: datetime = field(default_factory=datetime.now)
+    # Formaté une fois à la construction: strftime est coûteux et les pages
+    # l'affichaient à chaque rerun pour chaque ligne
+    created_at_display: str = field(init=False, compare=False, default="")
+    # Email normalisé une fois à la construction: la synchro comparait
+    # lower().strip() à chaque passage pour chaque personne
+    email_norm: str = field(init=False, compare=False, default="")
 
-@dataclass
+    def __post_init__(self):
+        self.created_at_display = self.created_at.strftime("%d/%m/%Y")
+        self.email_norm = self.email.lower().strip()
+
+@dataclass(slots=True)
 class Pole:
     """Modèle pôle/département"""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -21,12 +33,14 @@ class Pole:
     color: str = "#FF6B6B"
     is_active: bool = True
     created_at: datetime = field(default_factory=datetime.now)
+    # Libellé précalculé: les pages l'affichent pour chaque ligne à
+    # chaque rerun (même principe que created_at_display sur Person)
+    display_name: str = field(init=False, compare=False, default="")
     
-    @property
-    def display_name(self) -> str:
-        return f"📁 {self.name}"
+    def __post_init__(self):
+        self.display_name = f"📁 {self.name}"
 
-@dataclass
+@dataclass(slots=True)
 class Group:
     """Modèle groupe de personnes"""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -37,16 +51,16 @@ class Group:
     icon: str = "👥"
     is_active: bool = True
     created_at: datetime = field(default_factory=datetime.now)
+    display_name: str = field(init=False, compare=False, default="")
     
-    @property
-    def display_name(self) -> str:
-        return f"{self.icon} {self.name}"
+    def __post_init__(self):
+        self.display_name = f"{self.icon} {self.name}"
     
     @property
     def member_count(self) -> int:
         return len(self.member_ids)
 
-@dataclass
+@dataclass(slots=True)
 class Form:
     """Modèle formulaire avec pôle"""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -55,12 +69,14 @@ class Form:
     pole_id: str = ""
     people_ids: List[str] = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.now)
-    
-    @property
-    def url(self) -> str:
-        return f"https://docs.google.com/forms/d/{self.google_id}/viewform"
+    created_at_display: str = field(init=False, compare=False, default="")
+    url: str = field(init=False, compare=False, default="")
+
+    def __post_init__(self):
+        self.created_at_display = self.created_at.strftime("%d/%m/%Y")
+        self.url = f"https://docs.google.com/forms/d/{self.google_id}/viewform"
 
-@dataclass
+@dataclass(slots=True)
 class Response:
     """Modèle réponse"""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -1,8 +1,20 @@
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import Dict, List
 from database import Database
 from models import Form, Person
 
+# Gabarit par défaut des rappels, construit une seule fois au chargement
+# du module; {name} est substitué par destinataire dans send_reminders
+_DEFAULT_REMINDER_TEMPLATE = """Hello {name},
+
+Rappel pour remplir le formulaire "{form_name}".
+
+Lien: {url}
+
+Merci !"""
+
 class GoogleFormsService:
     """Service Google Forms simplifié"""
     
@@ -28,14 +40,24 @@ class GoogleFormsService:
 class MessengerService:
     """Service Messenger simplifié"""
     
+    # Nombre d'envois simultanés (l'attente est réseau, pas CPU)
+    MAX_CONCURRENT_SENDS = 16
+    
     def __init__(self, page_token: str):
         self.page_token = page_token
         self.base_url = "https://graph.facebook.com/v17.0/me/messages"
+        # Session partagée: connexions HTTPS réutilisées entre les envois
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.MAX_CONCURRENT_SENDS,
+            pool_maxsize=self.MAX_CONCURRENT_SENDS
+        )
+        self.session.mount("https://", adapter)
     
     def send_message(self, psid: str, message: str) -> bool:
         """Envoie un message"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}?access_token={self.page_token}",
                 json={
                     "recipient": {"id": psid},
@@ -56,51 +78,89 @@ class ReminderService:
         self.google = google_service
         self.messenger = messenger_service
     
+    # Nombre de formulaires synchronisés de front (borné par le réseau)
+    MAX_CONCURRENT_SYNCS = 8
+    
     def sync_form(self, form: Form) -> Dict[str, int]:
         """Synchronise un formulaire avec Google Forms"""
-        google_responses = self.google.get_responses(form.google_id)
+        return self._apply_sync(form, self.google.get_responses(form.google_id))
+    
+    def sync_all_forms(self, forms: List[Form]) -> Dict[str, Dict[str, int]]:
+        """Synchronise plusieurs formulaires: les requêtes Google se
+        recouvrent dans un pool de threads, les écritures en base
+        restent sur le thread appelant"""
+        if not forms:
+            return {}
+        workers = min(self.MAX_CONCURRENT_SYNCS, len(forms))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            all_responses = list(executor.map(
+                lambda f: self.google.get_responses(f.google_id), forms
+            ))
+        return {
+            form.id: self._apply_sync(form, google_responses)
+            for form, google_responses in zip(forms, all_responses)
+        }
+    
+    def _apply_sync(self, form: Form, google_responses: List[Dict[str, str]]) -> Dict[str, int]:
+        """Applique en base les réponses Google d'un formulaire"""
         responded_emails = {resp['email'] for resp in google_responses}
         
+        # Destinataires en une requête puis un seul UPDATE groupé, au lieu
+        # d'un get_person + mark_responded par personne
+        people = self.db.get_people_for_form(form.id)
         stats = {"updated": 0, "total": 0}
         
-        for person_id in form.people_ids:
-            person = self.db.get_person(person_id)
-            if not person or not person.email:
+        responded_ids = []
+        for person in people:
+            if not person.email_norm:
                 continue
             
             stats["total"] += 1
             
-            if person.email.lower().strip() in responded_emails:
-                if self.db.mark_responded(form.id, person_id):
-                    stats["updated"] += 1
+            if person.email_norm in responded_emails:
+                responded_ids.append(person.id)
         
+        stats["updated"] = self.db.mark_responded_bulk(form.id, responded_ids)
         return stats
     
     def send_reminders(self, form: Form, custom_message: str = None) -> Dict[str, int]:
         """Envoie des rappels pour un formulaire"""
         non_responders = self.db.get_non_responders(form.id)
         
-        message = custom_message or f"""Hello {{name}},
-
-Rappel pour remplir le formulaire "{form.name}".
-
-Lien: {form.url}
-
-Merci !"""
+        # Les parties fixes du message sont substituées une fois par
+        # appel; seul {name} reste à remplacer par destinataire
+        message = custom_message or (
+            _DEFAULT_REMINDER_TEMPLATE
+            .replace("{form_name}", form.name)
+            .replace("{url}", form.url)
+        )
         
         stats = {"sent": 0, "failed": 0}
         
+        pairs = []
         for person, response in non_responders:
             if not person.psid:
                 stats["failed"] += 1
                 continue
-            
-            personalized_message = message.replace("{name}", person.name)
-            
-            if self.messenger.send_message(person.psid, personalized_message):
-                self.db.record_reminder(form.id, person.id)
-                stats["sent"] += 1
-            else:
-                stats["failed"] += 1
+            pairs.append((person, message.replace("{name}", person.name)))
+        
+        # Envois en parallèle: la boucle série payait un aller-retour
+        # réseau par personne
+        sent_ids = []
+        if pairs:
+            workers = min(MessengerService.MAX_CONCURRENT_SENDS, len(pairs))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(
+                    lambda pm: self.messenger.send_message(pm[0].psid, pm[1]),
+                    pairs
+                )
+                for (person, _), ok in zip(pairs, results):
+                    if ok:
+                        sent_ids.append(person.id)
+                        stats["sent"] += 1
+                    else:
+                        stats["failed"] += 1
         
+        # Un seul UPDATE groupé (une transaction) au lieu d'un commit par envoi
+        self.db.record_reminders(form.id, sent_ids)
         return stats